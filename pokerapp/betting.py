@@ -6,7 +6,7 @@ Handles side pots for complex all-in scenarios.
 
 import logging
 from typing import Dict, List, Tuple
-from pokerapp.entities import Game, Money, Player, Score
+from pokerapp.entities import Game, Money, Player, Score, UserId
 from pokerapp.cards import Cards
 
 logger = logging.getLogger(__name__)
@@ -37,9 +37,10 @@ class SidePotCalculator:
             List of SidePot objects ordered from main → side → side...
         """
         # Get all players with money in pot (authorized amounts)
+        authorized = self._authorized_amounts(game)
         player_contributions = []
         for player in game.players:
-            contributed = player.wallet.authorized_money(game.id)
+            contributed = authorized[player.user_id]
             if contributed > 0:
                 player_contributions.append((player, contributed))
 
@@ -69,6 +70,34 @@ class SidePotCalculator:
 
         return side_pots
 
+    @staticmethod
+    def _authorized_amounts(game: Game) -> Dict[UserId, Money]:
+        """
+        Map user_id → authorized money for every seated player.
+
+        Wallets sharing one store and exposing ``authorized_money_many``
+        are fetched in a single round trip instead of one per player.
+        """
+        wallets = [player.wallet for player in game.players]
+        if wallets:
+            wallet_cls = type(wallets[0])
+            kv = getattr(wallets[0], "kv", None)
+            batch = getattr(wallet_cls, "authorized_money_many", None)
+            if batch is not None and kv is not None and all(
+                type(w) is wallet_cls and getattr(w, "kv", None) is kv
+                for w in wallets
+            ):
+                return batch(
+                    kv,
+                    [player.user_id for player in game.players],
+                    game.id,
+                )
+
+        return {
+            player.user_id: player.wallet.authorized_money(game.id)
+            for player in game.players
+        }
+
     def distribute_pots(
         self,
         side_pots: List[SidePot],
@@ -29,23 +29,28 @@ class Card(str):
 Cards = List[Card]
 
 
+# Cards are immutable strings, so every deal can share these instances.
+_FULL_DECK = (
+    Card("2♥"), Card("3♥"), Card("4♥"), Card("5♥"),
+    Card("6♥"), Card("7♥"), Card("8♥"), Card("9♥"),
+    Card("10♥"), Card("J♥"), Card("Q♥"), Card("K♥"),
+    Card("A♥"), Card("2♦"), Card("3♦"), Card("4♦"),
+    Card("5♦"), Card("6♦"), Card("7♦"), Card("8♦"),
+    Card("9♦"), Card("10♦"), Card("J♦"), Card("Q♦"),
+    Card("K♦"), Card("A♦"), Card("2♣"), Card("3♣"),
+    Card("4♣"), Card("5♣"), Card("6♣"), Card("7♣"),
+    Card("8♣"), Card("9♣"), Card("10♣"), Card("J♣"),
+    Card("Q♣"), Card("K♣"), Card("A♣"), Card("2♠"),
+    Card("3♠"), Card("4♠"), Card("5♠"), Card("6♠"),
+    Card("7♠"), Card("8♠"), Card("9♠"), Card("10♠"),
+    Card("J♠"), Card("Q♠"), Card("K♠"), Card("A♠"),
+)
+_RANDOM = random.SystemRandom()
+
+
 def get_cards() -> Cards:
-    cards = [
-        Card("2♥"), Card("3♥"), Card("4♥"), Card("5♥"),
-        Card("6♥"), Card("7♥"), Card("8♥"), Card("9♥"),
-        Card("10♥"), Card("J♥"), Card("Q♥"), Card("K♥"),
-        Card("A♥"), Card("2♦"), Card("3♦"), Card("4♦"),
-        Card("5♦"), Card("6♦"), Card("7♦"), Card("8♦"),
-        Card("9♦"), Card("10♦"), Card("J♦"), Card("Q♦"),
-        Card("K♦"), Card("A♦"), Card("2♣"), Card("3♣"),
-        Card("4♣"), Card("5♣"), Card("6♣"), Card("7♣"),
-        Card("8♣"), Card("9♣"), Card("10♣"), Card("J♣"),
-        Card("Q♣"), Card("K♣"), Card("A♣"), Card("2♠"),
-        Card("3♠"), Card("4♠"), Card("5♠"), Card("6♠"),
-        Card("7♠"), Card("8♠"), Card("9♠"), Card("10♠"),
-        Card("J♠"), Card("Q♠"), Card("K♠"), Card("A♠"),
-    ]
-    random.SystemRandom().shuffle(cards)
+    cards = list(_FULL_DECK)
+    _RANDOM.shuffle(cards)
     return cards
 
 
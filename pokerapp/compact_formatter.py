@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Optional
 
 from pokerapp.cards import Card
@@ -15,16 +16,14 @@ class CompactFormatter:
     constrained connections can still follow the game state without
     downloading large payloads."""
 
+    # Letter aliases only; glyph suits pass through ``.get(key, key)``.
     _SUIT_MAP = {
         "S": "♠",
         "H": "♥",
         "D": "♦",
         "C": "♣",
-        "♠": "♠",
-        "♥": "♥",
-        "♦": "♦",
-        "♣": "♣",
     }
+    _SUIT_GLYPHS = frozenset("♠♥♦♣")
 
     _RANK_MAP = {
         "ACE": "A",
@@ -62,7 +61,12 @@ class CompactFormatter:
         if not card_text:
             return "?", "?"
 
-        if ":" in card_text and card_text[-1] not in CompactFormatter._SUIT_MAP:
+        last = card_text[-1]
+        if (
+            ":" in card_text
+            and last not in CompactFormatter._SUIT_GLYPHS
+            and last not in CompactFormatter._SUIT_MAP
+        ):
             rank, suit = card_text.split(":", maxsplit=1)
         else:
             rank = card_text[:-1] or card_text
@@ -111,8 +115,12 @@ class CompactFormatter:
         return "▶️"
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def format_card(card: Card) -> str:
-        """Return a short "rank+suit" rendering such as "A♠" or "K♥"."""
+        """Return a short "rank+suit" rendering such as "A♠" or "K♥".
+
+        Cards are plain strings from a fixed deck, so each one is parsed once.
+        """
 
         rank_key, suit_key = CompactFormatter._extract_components(card)
         rank = CompactFormatter._RANK_MAP.get(rank_key, rank_key[:1])
@@ -125,7 +133,7 @@ class CompactFormatter:
 
         if not cards:
             return "—"
-        return " ".join(CompactFormatter.format_card(card) for card in cards)
+        return " ".join(map(CompactFormatter.format_card, cards))
 
     @staticmethod
     def format_player_compact(player: Player, show_cards: bool = False) -> str:
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Configuration management for Poker Telegram Bot."""
 
+import importlib.util
+import logging
 import os
 from typing import Dict, Iterable, Literal, Optional, cast
 from urllib.parse import urlparse, urlunparse
@@ -8,6 +10,8 @@ from urllib.parse import urlparse, urlunparse
 
 from pokerapp.entities import STAKE_PRESETS
 
+logger = logging.getLogger(__name__)
+
 
 def _first_env(
     names: Iterable[str],
@@ -55,6 +59,13 @@ class Config:
             ("POKERBOT_REDIS_PASS", "REDIS_PASS"),
             default="",
         ) or ""
+        # One pool is shared by every wallet and lobby lookup.
+        self.REDIS_MAX_CONNECTIONS: int = int(
+            _first_env(
+                ("POKERBOT_REDIS_MAX_CONNECTIONS", "REDIS_MAX_CONNECTIONS"),
+                default="64",
+            )
+        )
 
         # Debug mode
         self.DEBUG: bool = _parse_bool(
@@ -96,6 +107,18 @@ class Config:
         self.WRITE_TIMEOUT: int = int(
             os.getenv("WRITE_TIMEOUT", "30")
         )
+        # Outbound API calls and getUpdates use separate HTTPX pools, so a
+        # burst of sends never waits behind the long poll (or vice versa).
+        self.CONNECTION_POOL_SIZE: int = int(
+            os.getenv("CONNECTION_POOL_SIZE", "256")
+        )
+        self.GET_UPDATES_POOL_SIZE: int = int(
+            os.getenv("GET_UPDATES_POOL_SIZE", "1")
+        )
+        # HTTP/2 multiplexes concurrent sends over one TLS connection;
+        # opt in with HTTP_VERSION=2 (needs the python-telegram-bot[http2]
+        # extra, otherwise validate() falls back to HTTP/1.1).
+        self.HTTP_VERSION: str = os.getenv("HTTP_VERSION", "1.1").strip()
 
         # Webhook Settings (from your .env.example)
         self.WEBHOOK_LISTEN: str = _first_env(
@@ -218,6 +241,23 @@ class Config:
                 "POKERBOT_PREFERRED_MODE=webhook"
             )
 
+        if self.CONNECTION_POOL_SIZE < 1 or self.GET_UPDATES_POOL_SIZE < 1:
+            raise ValueError("HTTP connection pool sizes must be positive")
+
+        if self.HTTP_VERSION not in {"1.1", "2", "2.0"}:
+            raise ValueError("HTTP_VERSION must be one of: '1.1', '2', '2.0'")
+
+        if (
+            self.HTTP_VERSION != "1.1"
+            and importlib.util.find_spec("h2") is None
+        ):
+            logger.warning(
+                "HTTP_VERSION=%s needs the 'h2' package "
+                "(python-telegram-bot[http2]); falling back to HTTP/1.1",
+                self.HTTP_VERSION,
+            )
+            self.HTTP_VERSION = "1.1"
+
         if self.use_webhook:
             if not self.WEBHOOK_PUBLIC_URL:
                 raise ValueError(
@@ -50,6 +50,18 @@ class Wallet:
 
 
 class Player:
+    # Seats are read on every table render; slots keep attribute access
+    # off the instance dict.
+    __slots__ = (
+        "user_id",
+        "mention_markdown",
+        "state",
+        "wallet",
+        "cards",
+        "round_rate",
+        "ready_message_id",
+    )
+
     def __init__(
         self,
         user_id: UserId,
@@ -57,7 +69,8 @@ class Player:
         wallet: Wallet,
         ready_message_id: Optional[MessageId],
     ):
-        self.user_id = user_id
+        # Telegram ids are ints; normalizing here keeps comparisons cheap.
+        self.user_id = int(user_id)
         self.mention_markdown = mention_markdown
         self.state = PlayerState.ACTIVE
         self.wallet = wallet
@@ -66,7 +79,8 @@ class Player:
         self.ready_message_id = ready_message_id
 
     def __repr__(self):
-        return "{}({!r})".format(self.__class__.__name__, self.__dict__)
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        return "{}({!r})".format(self.__class__.__name__, fields)
 
 
 class PlayerState(enum.Enum):
@@ -101,6 +115,9 @@ class Game:
         self.max_round_rate = 0
         self.state = GameState.INITIAL
         self.players: List[Player] = []
+        self._players_index: Dict[int, Player] = {}
+        self._players_index_source: Optional[List[Player]] = None
+        self._players_index_size = 0
         self.cards_table = []
         self.current_player_index = -1
         self.remain_cards = get_cards()
@@ -150,6 +167,24 @@ class Game:
     def players_by(self, states: Tuple[PlayerState]) -> List[Player]:
         return list(filter(lambda p: p.state in states, self.players))
 
+    @property
+    def players_by_id(self) -> Dict[int, Player]:
+        """Seated players keyed by ``user_id``.
+
+        The index is rebuilt only when ``players`` is reassigned or changes
+        length; reordering seats in place keeps it valid.
+        """
+
+        players = self.players
+        if (
+            self._players_index_source is not players
+            or self._players_index_size != len(players)
+        ):
+            self._players_index = {p.user_id: p for p in players}
+            self._players_index_source = players
+            self._players_index_size = len(players)
+        return self._players_index
+
     def __repr__(self):
         return "{}({!r})".format(self.__class__.__name__, self.__dict__)
 
@@ -21,6 +21,21 @@ from pokerapp.kvstore import ensure_kv
 
 logger = logging.getLogger(__name__)
 
+NEXT_STREET = {
+    GameState.ROUND_PRE_FLOP: GameState.ROUND_FLOP,
+    GameState.ROUND_FLOP: GameState.ROUND_TURN,
+    GameState.ROUND_TURN: GameState.ROUND_RIVER,
+    GameState.ROUND_RIVER: GameState.FINISHED,
+}
+# Community cards dealt when each street opens
+STREET_CARD_COUNTS = {
+    GameState.ROUND_PRE_FLOP: 0,
+    GameState.ROUND_FLOP: 3,
+    GameState.ROUND_TURN: 1,
+    GameState.ROUND_RIVER: 1,
+    GameState.FINISHED: 0,
+}
+
 
 class TurnResult(Enum):
     """Result of processing a player turn"""
@@ -442,19 +457,12 @@ class PokerEngine:
         return self._move_to_next_street(game)
 
     def _move_to_next_street(self, game: Game) -> GameState:
-        state_transitions = {
-            GameState.ROUND_PRE_FLOP: GameState.ROUND_FLOP,
-            GameState.ROUND_FLOP: GameState.ROUND_TURN,
-            GameState.ROUND_TURN: GameState.ROUND_RIVER,
-            GameState.ROUND_RIVER: GameState.FINISHED,
-        }
-
         current_state = game.state
 
-        if current_state not in state_transitions:
+        if current_state not in NEXT_STREET:
             raise ValueError(f"Cannot advance from state: {current_state}")
 
-        new_state = state_transitions[current_state]
+        new_state = NEXT_STREET[current_state]
         game.state = new_state
 
         for player in game.players:
@@ -488,14 +496,7 @@ class PokerEngine:
         Returns:
             Card count (0=pre-flop, 3=flop, 1=turn/river)
         """
-        card_counts = {
-            GameState.ROUND_PRE_FLOP: 0,
-            GameState.ROUND_FLOP: 3,
-            GameState.ROUND_TURN: 1,
-            GameState.ROUND_RIVER: 1,
-            GameState.FINISHED: 0,
-        }
-        return card_counts.get(game_state, 0)
+        return STREET_CARD_COUNTS.get(game_state, 0)
 
 
 class GameEngine:
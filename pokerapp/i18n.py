@@ -43,6 +43,19 @@ class _SafeFormatDict(dict):
         return "{" + key + "}"
 
 
+# Language-specific currency layouts, built once instead of per call
+_CURRENCY_FORMATS: Dict[str, Callable[[int, str], str]] = {
+    "en": lambda a, s: f"{s}{a:,}",              # $1,500
+    "es": lambda a, s: f"{s}{a:,}".replace(",", "."),  # $1.500
+    "fr": lambda a, s: f"{a:,} {s}".replace(",", " "),  # 1 500 $
+    "de": lambda a, s: f"{a:,} {s}".replace(",", "."),  # 1.500 $
+    "ru": lambda a, s: f"{a:,} {s}".replace(",", " "),  # 1 500 $
+    "zh": lambda a, s: f"{s}{a:,}",              # $1,500
+    "ja": lambda a, s: f"{s}{a:,}",              # $1,500
+    "ar": lambda a, s: f"{s}{a:,}",              # $1,500 (RTL handled separately)
+}
+
+
 class TranslationManager:
     """
     Manages translations and locale-specific formatting.
@@ -535,12 +548,14 @@ class TranslationManager:
             )
             return f"[{key}]"
 
-        # Format with provided variables
-        try:
-            safe_kwargs = _SafeFormatDict(**kwargs)
-        except TypeError:
-            safe_kwargs = _SafeFormatDict()
-            safe_kwargs.update({str(k): v for k, v in kwargs.items()})
+        # Plain labels make up most lookups on the render path; without
+        # variables or braces format_map would hand back the same string.
+        if not kwargs and "{" not in translation:
+            return translation
+
+        # Format with provided variables; kwargs already has str keys, so
+        # copy it into the lenient mapping without re-binding arguments.
+        safe_kwargs = _SafeFormatDict(kwargs)
 
         try:
             return translation.format_map(safe_kwargs)
@@ -592,19 +607,7 @@ class TranslationManager:
             >>> format_currency(1500, "de")
             "1.500$"
         """
-        # Language-specific formatting rules
-        formatting_rules = {
-            "en": lambda a, s: f"{s}{a:,}",              # $1,500
-            "es": lambda a, s: f"{s}{a:,}".replace(",", "."),  # $1.500
-            "fr": lambda a, s: f"{a:,} {s}".replace(",", " "),  # 1 500 $
-            "de": lambda a, s: f"{a:,} {s}".replace(",", "."),  # 1.500 $
-            "ru": lambda a, s: f"{a:,} {s}".replace(",", " "),  # 1 500 $
-            "zh": lambda a, s: f"{s}{a:,}",              # $1,500
-            "ja": lambda a, s: f"{s}{a:,}",              # $1,500
-            "ar": lambda a, s: f"{s}{a:,}",              # $1,500 (RTL handled separately)
-        }
-
-        formatter = formatting_rules.get(language, formatting_rules["en"])
+        formatter = _CURRENCY_FORMATS.get(language, _CURRENCY_FORMATS["en"])
         return formatter(amount, currency_symbol)
 
     def get_supported_languages(self) -> List[Dict[str, str]]:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional, Set
 
 import redis
 
@@ -12,14 +12,55 @@ import redis
 logger = logging.getLogger(__name__)
 
 
-def _to_bytes(value: Any) -> Optional[bytes]:
+def _to_str(value: Any) -> Optional[str]:
+    """Mirror ``redis.Redis(decode_responses=True)`` reply decoding."""
+
     if value is None:
         return None
-    if isinstance(value, bytes):
-        return value
     if isinstance(value, str):
-        return value.encode("utf-8")
-    return str(value).encode("utf-8")
+        return value
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+# Move ARGV[1] chips from the balance at KEYS[1] to the authorized pot at
+# KEYS[2]; nil when the balance cannot cover it.
+_AUTHORIZE_FUNDS_LUA = """
+local balance = tonumber(redis.call('GET', KEYS[1]) or '0')
+local amount = tonumber(ARGV[1])
+if balance < amount then
+    return false
+end
+redis.call('INCRBY', KEYS[2], amount)
+return redis.call('INCRBY', KEYS[1], -amount)
+"""
+
+# Move the whole balance at KEYS[1] to KEYS[2]; returns the moved amount.
+_AUTHORIZE_ALL_FUNDS_LUA = """
+local balance = tonumber(redis.call('GET', KEYS[1]) or '0')
+redis.call('INCRBY', KEYS[2], balance)
+redis.call('SET', KEYS[1], 0)
+return balance
+"""
+
+
+def _authorize_funds(kv: Any, balance_key: str, auth_key: str, amount: int):
+    """Python twin of ``_AUTHORIZE_FUNDS_LUA`` for stores without Lua."""
+
+    if int(kv.get(balance_key) or 0) < amount:
+        return None
+    kv.incrby(auth_key, amount)
+    return kv.incrby(balance_key, -amount)
+
+
+def _authorize_all_funds(kv: Any, balance_key: str, auth_key: str):
+    """Python twin of ``_AUTHORIZE_ALL_FUNDS_LUA``."""
+
+    balance = int(kv.get(balance_key) or 0)
+    kv.incrby(auth_key, balance)
+    kv.set(balance_key, 0)
+    return balance
 
 
 class InMemoryKV:
@@ -28,9 +69,16 @@ class InMemoryKV:
     def __init__(self) -> None:
         self._values: Dict[str, Any] = {}
         self._lists: DefaultDict[str, List[Any]] = defaultdict(list)
+        self._sets: Dict[str, Set[str]] = {}
 
     def get(self, key: str):  # pragma: no cover - trivial wrapper
-        return _to_bytes(self._values.get(key))
+        return _to_str(self._values.get(key))
+
+    def mget(self, keys: List[str]):
+        return [_to_str(self._values.get(key)) for key in keys]
+
+    def getdel(self, key: str):
+        return _to_str(self._values.pop(key, None))
 
     # pragma: no cover - trivial wrapper
     def set(self, key: str, value: Any, **kwargs: Any):
@@ -45,7 +93,13 @@ class InMemoryKV:
         return True
 
     def exists(self, key: str):  # pragma: no cover - trivial wrapper
-        return int(key in self._values or key in self._lists)
+        return int(
+            key in self._values or key in self._lists or key in self._sets
+        )
+
+    def expire(self, key: str, seconds: int):
+        # Like ``set(..., ex=...)`` here, TTLs are not tracked in memory.
+        return bool(self.exists(key))
 
     def incrby(self, key: str, amount: int):
         current = int(self._values.get(key, 0))
@@ -56,15 +110,19 @@ class InMemoryKV:
     # pragma: no cover - trivial wrapper
     def delete(
         self,
-        key: str,
+        *keys: str,
     ):
         removed = 0
-        if key in self._values:
-            del self._values[key]
-            removed += 1
-        if key in self._lists:
-            del self._lists[key]
-            removed += 1
+        for key in keys:
+            if key in self._values:
+                del self._values[key]
+                removed += 1
+            if key in self._lists:
+                del self._lists[key]
+                removed += 1
+            if key in self._sets:
+                del self._sets[key]
+                removed += 1
         return removed
 
     # pragma: no cover - trivial wrapper
@@ -84,10 +142,41 @@ class InMemoryKV:
         if key not in self._lists or not self._lists[key]:
             return None
         value = self._lists[key].pop()
-        return _to_bytes(value)
+        return _to_str(value)
+
+    def sadd(self, key: str, *values: Any):
+        members = self._sets.setdefault(key, set())
+        before = len(members)
+        members.update(_to_str(value) for value in values)
+        return len(members) - before
+
+    def srem(self, key: str, *values: Any):
+        members = self._sets.get(key)
+        if not members:
+            return 0
+        before = len(members)
+        members.difference_update(_to_str(value) for value in values)
+        if not members:
+            del self._sets[key]
+        return before - len(members)
+
+    def scard(self, key: str):
+        return len(self._sets.get(key, ()))
+
+    def smembers(self, key: str):
+        return set(self._sets.get(key, ()))
+
+    def sismember(self, key: str, value: Any):
+        return _to_str(value) in self._sets.get(key, ())
 
     # High-level helpers -------------------------------------------------
 
+    def authorize_funds(self, balance_key: str, auth_key: str, amount: int):
+        return _authorize_funds(self, balance_key, auth_key, amount)
+
+    def authorize_all_funds(self, balance_key: str, auth_key: str):
+        return _authorize_all_funds(self, balance_key, auth_key)
+
     def set_user_language(self, user_id: int, language_code: str) -> None:
         """Store the preferred language for ``user_id``."""
 
@@ -125,6 +214,31 @@ class RedisKVStore:
     def __init__(self, backend: Optional[redis.Redis] = None) -> None:
         self._backend = backend
         self._fallback = InMemoryKV()
+        self._scripts: Dict[str, Any] = {}
+
+    def _run_script(
+        self,
+        source: str,
+        keys: List[str],
+        args: List[Any],
+        emulate: Any,
+    ):
+        """Run a Lua script in one round trip, or *emulate* it.
+
+        Backends without ``register_script`` (and the in-memory fallback)
+        run the Python twin through this wrapper's own commands instead.
+        """
+
+        register = getattr(self._backend, "register_script", None)
+        if register is not None:
+            try:
+                script = self._scripts.get(source)
+                if script is None:
+                    script = self._scripts[source] = register(source)
+                return script(keys=keys, args=args)
+            except redis.exceptions.RedisError:
+                self._backend = None
+        return emulate(self, *keys, *args)
 
     def _call(self, method: str, *args: Any, **kwargs: Any):
         if self._backend is not None:
@@ -143,6 +257,12 @@ class RedisKVStore:
     ):  # pragma: no cover - trivial wrapper
         return self._call("get", key)
 
+    def mget(self, keys: List[str]):
+        return self._call("mget", keys)
+
+    def getdel(self, key: str):
+        return self._call("getdel", key)
+
     # pragma: no cover - trivial wrapper
     def set(
         self,
@@ -166,15 +286,18 @@ class RedisKVStore:
     ):
         return self._call("exists", key)
 
+    def expire(self, key: str, seconds: int):
+        return self._call("expire", key, seconds)
+
     def incrby(self, key: str, amount: int):
         return self._call("incrby", key, amount)
 
     # pragma: no cover - trivial wrapper
     def delete(
         self,
-        key: str,
+        *keys: str,
     ):
-        return self._call("delete", key)
+        return self._call("delete", *keys)
 
     # pragma: no cover - trivial wrapper
     def rpush(
@@ -191,6 +314,48 @@ class RedisKVStore:
     ):
         return self._call("rpop", key)
 
+    def sadd(self, key: str, *values: Any):
+        return self._call("sadd", key, *values)
+
+    def srem(self, key: str, *values: Any):
+        return self._call("srem", key, *values)
+
+    def scard(self, key: str):
+        return self._call("scard", key)
+
+    def smembers(self, key: str):
+        return self._call("smembers", key)
+
+    def sismember(self, key: str, value: Any):
+        return self._call("sismember", key, value)
+
+    # ------------------------------------------------------------------
+    # Wallet helpers
+    # ------------------------------------------------------------------
+
+    def authorize_funds(self, balance_key: str, auth_key: str, amount: int):
+        """Atomically move *amount* from *balance_key* to *auth_key*.
+
+        Returns the new balance, or ``None`` when it cannot cover *amount*.
+        """
+
+        return self._run_script(
+            _AUTHORIZE_FUNDS_LUA,
+            [balance_key, auth_key],
+            [amount],
+            _authorize_funds,
+        )
+
+    def authorize_all_funds(self, balance_key: str, auth_key: str):
+        """Atomically move the whole balance to *auth_key*; return it."""
+
+        return self._run_script(
+            _AUTHORIZE_ALL_FUNDS_LUA,
+            [balance_key, auth_key],
+            [],
+            _authorize_all_funds,
+        )
+
     # ------------------------------------------------------------------
     # Language preference helpers
     # ------------------------------------------------------------------
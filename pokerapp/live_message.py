@@ -10,6 +10,9 @@ import hashlib
 import html
 import json
 import time
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import zip_longest
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
@@ -30,6 +33,14 @@ from pokerapp.keyboard_utils import (
 )
 
 
+# Distinct boards kept in the rendered board-line LRU
+BOARD_TEXT_CACHE_SIZE = 256
+# Rendered table texts kept per manager, keyed by their inputs
+STATE_TEXT_CACHE_SIZE = 128
+# Built action keyboards kept per manager, keyed by their inputs
+KEYBOARD_CACHE_SIZE = 256
+
+
 NUMBER_NORMALIZATION_TABLE = str.maketrans(
     "۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩",
     "01234567890123456789",
@@ -45,6 +56,19 @@ def normalize_numbers(text: str) -> str:
     return text.translate(NUMBER_NORMALIZATION_TABLE)
 
 
+@lru_cache(maxsize=1024)
+def _mention_display_name(mention: str) -> str:
+    """Name inside a ``[name](tg://user?id=…)`` mention, or ``""``.
+
+    Mentions are fixed for a player's session, so every refresh after the
+    first skips the split.
+    """
+
+    if mention.startswith("[") and "](" in mention:
+        return mention.split("]")[0][1:]
+    return ""
+
+
 class UnicodeTextFormatter:
     """Format text using Unicode characters and emojis - no HTML/Markdown."""
 
@@ -168,6 +192,9 @@ class RaiseOptionMeta:
     kind: str  # "amount", "pot", "all_in"
 
 
+KeyboardResult = Tuple[Optional[InlineKeyboardMarkup], List[RaiseOptionMeta]]
+
+
 @dataclass(slots=True)
 class ChatRenderState:
     """Mutable rendering data tracked per chat for diffing & UX features."""
@@ -239,6 +266,15 @@ class LiveMessageManager:
         "actor_user_id",
         "recent_actions",
     )
+    # Hashable context fields read by _build_game_state_text
+    STATE_TEXT_KEYS: Tuple[str, ...] = (
+        "table_code",
+        "seat_label",
+        "stage_name",
+        "stage_icon",
+        "last_bet_value",
+        "timer_label",
+    )
 
 
     def __init__(
@@ -263,6 +299,14 @@ class LiveMessageManager:
         self._language_code = "en"
         self._language_direction = "ltr"
         self._language_font = "system"
+        # tuple(board cards) -> rendered board line, least recent first
+        self._board_text_cache: "OrderedDict[Tuple[str, ...], str]" = OrderedDict()
+        # render inputs -> table text from _build_game_state_text
+        self._state_text_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        # (language, actor, seats) -> player list block of that text
+        self._seat_block_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
+        # layout inputs -> (action keyboard, raise options)
+        self._keyboard_cache: "OrderedDict[Tuple[Any, ...], KeyboardResult]" = OrderedDict()
 
     def _prepare_plain_text(self, text: str) -> str:
         """Convert any formatted text to plain Unicode text for all languages."""
@@ -329,18 +373,6 @@ class LiveMessageManager:
         formatted = f"{amount:,}"
         return f"$ {formatted:>{width - 2}}"
 
-    @staticmethod
-    def _format_mobile_button_label(
-        emoji: str,
-        text: str,
-        *,
-        emoji_scale: float = 1.5,
-    ) -> str:
-        if emoji_scale > 1.0:
-            return f"{emoji}\u200A {text}"
-
-        return f"{emoji} {text}"
-
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -1055,6 +1087,35 @@ class LiveMessageManager:
             return self._sanitize_text(f"${numeric:,}")
 
         language_code = context.get("language_code", "en")
+
+        # Timer ticks and edit retries re-render an unchanged table; the
+        # key covers every input the text below reads.
+        players = list(getattr(game, "players", []) or [])
+        stacks = [self._player_stack(player) for player in players]
+        seats_key = tuple(
+            (
+                player.user_id,
+                getattr(player, "mention_markdown", None),
+                getattr(player, "state", None),
+                stack,
+            )
+            for player, stack in zip(players, stacks)
+        )
+        cache_key = (
+            language_code,
+            tuple(context.get(key) for key in self.STATE_TEXT_KEYS),
+            tuple(context.get("recent_actions") or ()),
+            max(getattr(game, "pot", 0), 0),
+            tuple(getattr(game, "cards_table", []) or []),
+            getattr(current_player, "user_id", None),
+            getattr(current_player, "mention_markdown", None),
+            seats_key,
+        )
+        cached = self._state_text_cache.get(cache_key)
+        if cached is not None:
+            self._state_text_cache.move_to_end(cache_key)
+            return cached
+
         sections: List[str] = []
 
         # ═══════════════════════════════════════════════════
@@ -1133,16 +1194,17 @@ class LiveMessageManager:
         # ═══════════════════════════════════════════════════
         # SECTION 5: ACTIVE PLAYER COUNT
         # ═══════════════════════════════════════════════════
-        players = list(getattr(game, "players", []) or [])
+        inactive_states = (PlayerState.FOLD, None)
         active_count = sum(
-            1 for p in players if getattr(p, "state", None) not in {PlayerState.FOLD, None}
+            1 for p in players if getattr(p, "state", None) not in inactive_states
         )
 
-        active_format = translation_manager.t(
+        active_text = translation_manager.t(
             "viewer.game.active_players",
-            lang=language_code
+            lang=language_code,
+            active=active_count,
+            total=len(players),
         )
-        active_text = active_format.format(active=active_count, total=len(players))
         sections.append(f"👥 {active_text}")
 
         if not players:
@@ -1155,53 +1217,23 @@ class LiveMessageManager:
         # ═══════════════════════════════════════════════════
         # SECTION 6: PLAYER LIST (joined with newline, not blank line)
         # ═══════════════════════════════════════════════════
+        # Pot, bet and timer changes leave the seats alone, so the block is
+        # cached on its own and reused when only those lines move.
         actor_id = getattr(current_player, "user_id", None) if current_player else None
-        player_lines: List[str] = []
-
-        fold_label = translation_manager.t(
-            "viewer.game.player_state.fold",
-            lang=language_code
-        )
-        all_in_label = translation_manager.t(
-            "viewer.game.player_state.all_in",
-            lang=language_code
-        )
-        waiting_label = translation_manager.t(
-            "viewer.game.player_state.waiting",
-            lang=language_code
-        )
-
-        for player in players:
-            name = self._sanitize_text(self._get_player_name(player))
-            if len(name) > 20:
-                name = name[:19] + "…"
-
-            wallet = getattr(player, "wallet", None)
-            stack = 0
-            if wallet:
-                wallet_val = getattr(wallet, "value", 0)
-                stack = max(int(wallet_val() if callable(wallet_val) else wallet_val), 0)
-
-            state = getattr(player, "state", None)
-
-            if state == PlayerState.FOLD:
-                icon = "❌"
-                status = f" • {fold_label}"
-            elif state == PlayerState.ALL_IN:
-                icon = "🔥"
-                status = f" • {all_in_label}"
-            elif actor_id and player.user_id == actor_id:
-                icon = "✅"
-                status = ""
-            else:
-                icon = "🚫"
-                status = f" • {waiting_label}"
-
-            player_line = f"{icon} {name} • {_inline_amount(stack)}{status}"
-            player_lines.append(player_line)
+        seat_key = (language_code, actor_id, seats_key)
+        seat_block = self._seat_block_cache.get(seat_key)
+        if seat_block is not None:
+            self._seat_block_cache.move_to_end(seat_key)
+        else:
+            seat_block = self._render_seat_block(
+                players, stacks, actor_id, language_code, _inline_amount
+            )
+            self._seat_block_cache[seat_key] = seat_block
+            if len(self._seat_block_cache) > STATE_TEXT_CACHE_SIZE:
+                self._seat_block_cache.popitem(last=False)
 
-        if player_lines:
-            sections.append("\n".join(player_lines))
+        if seat_block:
+            sections.append(seat_block)
         else:
             no_players_text = translation_manager.t(
                 "viewer.lobby.no_players",
@@ -1225,20 +1257,78 @@ class LiveMessageManager:
         # ═══════════════════════════════════════════════════
         # SECTION 8: ACTION ITEMS (joined with newline, not blank line)
         # ═══════════════════════════════════════════════════
-        action_lines: List[str] = []
-        for action in recent[-5:]:  # Last 5 actions
-            action_text = self._sanitize_text(action)
-            action_lines.append(f"• {action_text}")
-
-        if action_lines:
-            sections.append("\n".join(action_lines))
+        if recent:
+            # Last 5 actions
+            sections.append(
+                "\n".join([f"• {self._sanitize_text(action)}" for action in recent[-5:]])
+            )
 
         # ═══════════════════════════════════════════════════
         # FINAL ASSEMBLY: Join sections with double newlines
         # ═══════════════════════════════════════════════════
-        message_text = "\n\n".join(section for section in sections if section)
+        message_text = "\n\n".join(filter(None, sections))
 
-        return normalize_numbers(message_text)
+        text = normalize_numbers(message_text)
+        self._state_text_cache[cache_key] = text
+        if len(self._state_text_cache) > STATE_TEXT_CACHE_SIZE:
+            self._state_text_cache.popitem(last=False)
+        return text
+
+    def _render_seat_block(
+        self,
+        players: List[Player],
+        stacks: List[int],
+        actor_id: Optional[int],
+        language_code: str,
+        inline_amount: Callable[[Any], str],
+    ) -> str:
+        """One line per seat: badge, name, stack and status."""
+
+        fold_label = translation_manager.t(
+            "viewer.game.player_state.fold",
+            lang=language_code
+        )
+        all_in_label = translation_manager.t(
+            "viewer.game.player_state.all_in",
+            lang=language_code
+        )
+        waiting_label = translation_manager.t(
+            "viewer.game.player_state.waiting",
+            lang=language_code
+        )
+        # (icon, status suffix) per seat state; the actor and everyone
+        # else waiting fall through to the last two entries.
+        state_badges = {
+            PlayerState.FOLD: ("❌", f" • {fold_label}"),
+            PlayerState.ALL_IN: ("🔥", f" • {all_in_label}"),
+        }
+        actor_badge = ("✅", "")
+        waiting_badge = ("🚫", f" • {waiting_label}")
+
+        def seat_line(player: Player, stack: int) -> str:
+            name = self._sanitize_text(self._get_player_name(player))
+            if len(name) > 20:
+                name = name[:19] + "…"
+
+            badge = state_badges.get(getattr(player, "state", None))
+            if badge is None:
+                is_actor = actor_id and player.user_id == actor_id
+                badge = actor_badge if is_actor else waiting_badge
+
+            icon, status = badge
+            return f"{icon} {name} • {inline_amount(stack)}{status}"
+
+        return "\n".join(
+            [seat_line(player, stack) for player, stack in zip(players, stacks)]
+        )
+
+    @staticmethod
+    def _player_stack(player: Player) -> int:
+        wallet = getattr(player, "wallet", None)
+        if not wallet:
+            return 0
+        wallet_val = getattr(wallet, "value", 0)
+        return max(int(wallet_val() if callable(wallet_val) else wallet_val), 0)
 
     def _format_game_state(
         self,
@@ -1380,10 +1470,20 @@ class LiveMessageManager:
         if not cards:
             return "🂠 🂠 🂠"
 
+        # Every spectator refresh of an unchanged board reuses the line.
+        key = tuple(cards)
+        cached = self._board_text_cache.get(key)
+        if cached is not None:
+            self._board_text_cache.move_to_end(key)
+            return cached
+
         from pokerapp.pokerbotview import PokerBotViewer
 
-        formatted = [PokerBotViewer._format_card(card) for card in cards]
-        return " - ".join(formatted)
+        line = " - ".join(map(PokerBotViewer._format_card, cards))
+        self._board_text_cache[key] = line
+        if len(self._board_text_cache) > BOARD_TEXT_CACHE_SIZE:
+            self._board_text_cache.popitem(last=False)
+        return line
 
     def _get_action_emoji(self, action_text: str) -> str:
         """Return emoji based on action type."""
@@ -1410,7 +1510,7 @@ class LiveMessageManager:
 
         cards = getattr(game, "cards_table", []) or []
         cards_repr = (
-            "".join(sorted(str(card) for card in cards)) if cards else "NONE"
+            "".join(sorted(cards)) if cards else "NONE"
         )
 
         pot_value = getattr(game, "pot", 0)
@@ -1595,20 +1695,66 @@ class LiveMessageManager:
         *,
         use_cache: bool = True,
         device_profile: Optional[DeviceProfile] = None,
-    ) -> Tuple[Optional[InlineKeyboardMarkup], List[RaiseOptionMeta]]:
+    ) -> KeyboardResult:
         if player is None:
             return None, []
 
         profile = device_profile or self._device_detector.detect_device()
-        emoji_scale = getattr(profile, "emoji_size_multiplier", 1.0)
-        is_mobile = getattr(profile, "max_line_length", 0) <= 40
-        variant_key = getattr(getattr(profile, "device_type", None), "value", "default")
+        stake_config = game.stake_config
+        # Everything the layout reads; a version bump or any bet, stack or
+        # pot change yields a new key, so entries never need invalidating.
+        keyboard_key = (
+            game.id,
+            version,
+            self._language_code,
+            profile.device_type.value,
+            profile.emoji_size_multiplier,
+            profile.max_line_length,
+            game.max_round_rate,
+            player.round_rate,
+            player.wallet.value(),
+            game.pot,
+            game.table_stake,
+            stake_config.big_blind if stake_config else 0,
+        )
+
+        if use_cache:
+            cached = self._keyboard_cache.get(keyboard_key)
+            if cached is not None:
+                self._keyboard_cache.move_to_end(keyboard_key)
+                markup, options = cached
+                return markup, list(options)
+
+        markup, options = self._render_action_inline_keyboard(
+            game,
+            player,
+            version,
+            use_cache=use_cache,
+            profile=profile,
+        )
+        self._keyboard_cache[keyboard_key] = (markup, options)
+        if len(self._keyboard_cache) > KEYBOARD_CACHE_SIZE:
+            self._keyboard_cache.popitem(last=False)
+        return markup, list(options)
+
+    def _render_action_inline_keyboard(
+        self,
+        game: Game,
+        player: Player,
+        version: Optional[int],
+        *,
+        use_cache: bool,
+        profile: DeviceProfile,
+    ) -> KeyboardResult:
+        emoji_scale = profile.emoji_size_multiplier
+        is_mobile = profile.max_line_length <= 40
+        variant_key = profile.device_type.value
         cache_variant = f"{variant_key}:{self._language_code}"
 
         cache_allowed = (
             use_cache
             and getattr(self, "_render_cache", None) is not None
-            and getattr(profile, "max_line_length", 0) >= 50
+            and profile.max_line_length >= 50
         )
 
         if cache_allowed:
@@ -1631,7 +1777,7 @@ class LiveMessageManager:
         player_bet = max(player.round_rate, 0)
         player_balance = max(player.wallet.value(), 0)
         call_amount = max(current_bet - player_bet, 0)
-        game_id = str(getattr(game, "id", ""))
+        game_id = str(game.id)
         version_segment: List[str] = []
         if version is not None:
             version_segment.append(str(version))
@@ -1640,11 +1786,9 @@ class LiveMessageManager:
         can_raise = any(opt.kind in {"amount", "pot"} for opt in options)
         has_all_in_option = any(opt.kind == "all_in" for opt in options)
 
-        stake_config = getattr(game, "stake_config", None)
-        config_big_blind = (
-            getattr(stake_config, "big_blind", 0) if stake_config else 0
-        )
-        table_big_blind = (getattr(game, "table_stake", 0) or 0) * 2
+        stake_config = game.stake_config
+        config_big_blind = stake_config.big_blind if stake_config else 0
+        table_big_blind = (game.table_stake or 0) * 2
         baseline_big_blind = max(config_big_blind, table_big_blind, 20)
         min_raise = max(current_bet * 2, baseline_big_blind)
 
@@ -1661,10 +1805,18 @@ class LiveMessageManager:
         if has_all_in_option and player_balance > 0:
             available_actions.add(PlayerAction.ALL_IN)
 
+        # The version/game tail is shared by every button on this keyboard.
+        callback_tail = ":" + ":".join([*version_segment, game_id])
+
         def _callback(action: str, *extra: str) -> str:
-            return ":".join(["action", action, *extra, *version_segment, game_id])
+            if extra:
+                action = ":".join((action, *extra))
+            return "action:" + action + callback_tail
 
         if is_mobile:
+            # Scaled emoji get a hair space so they don't crowd the label.
+            mobile_sep = "\u200A " if emoji_scale > 1.0 else " "
+
             def _build_mobile_buttons() -> List[List[InlineKeyboardButton]]:
                 mobile_rows: List[List[InlineKeyboardButton]] = []
 
@@ -1672,11 +1824,7 @@ class LiveMessageManager:
                     mobile_rows.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_label(
-                                    "✅",
-                                    "CHECK",
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"✅{mobile_sep}CHECK",
                                 callback_data=_callback("check"),
                             )
                         ]
@@ -1685,11 +1833,7 @@ class LiveMessageManager:
                     mobile_rows.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_label(
-                                    "💰",
-                                    f"CALL ${call_amount:,}",
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"💰{mobile_sep}CALL ${call_amount:,}",
                                 callback_data=_callback("call"),
                             )
                         ]
@@ -1702,7 +1846,7 @@ class LiveMessageManager:
                     if min_raise <= max_raise:
                         presets.append(("📈", f"MIN (${min_raise:,})", min_raise))
 
-                    pot_amount = max(getattr(game, "pot", 0), 0)
+                    pot_amount = max(game.pot, 0)
                     two_pot = pot_amount * 2
                     if min_raise <= two_pot <= max_raise:
                         presets.append(("📈", f"2×POT (${two_pot:,})", two_pot))
@@ -1715,32 +1859,26 @@ class LiveMessageManager:
                     ):
                         presets.append(("💼", f"½STACK (${half_stack:,})", half_stack))
 
-                    for i in range(0, len(presets), 2):
-                        chunk = presets[i: i + 2]
-                        row: List[InlineKeyboardButton] = []
-                        for emoji, label, amount in chunk:
-                            row.append(
-                                InlineKeyboardButton(
-                                    self._format_mobile_button_label(
-                                        emoji,
-                                        label,
-                                        emoji_scale=emoji_scale,
-                                    ),
-                                    callback_data=_callback("raise", str(amount)),
-                                )
+                    preset_buttons = iter(
+                        [
+                            InlineKeyboardButton(
+                                f"{emoji}{mobile_sep}{label}",
+                                callback_data=_callback("raise", str(amount)),
                             )
-                        if row:
-                            mobile_rows.append(row)
+                            for emoji, label, amount in presets
+                        ]
+                    )
+                    # Zipping one iterator with itself pairs presets per row.
+                    mobile_rows.extend(
+                        [button for button in pair if button is not None]
+                        for pair in zip_longest(preset_buttons, preset_buttons)
+                    )
 
                 if PlayerAction.ALL_IN in available_actions:
                     mobile_rows.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_label(
-                                    "🔥",
-                                    f"ALL-IN ${player_balance:,}",
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"🔥{mobile_sep}ALL-IN ${player_balance:,}",
                                 callback_data=_callback("all_in"),
                             )
                         ]
@@ -1750,11 +1888,7 @@ class LiveMessageManager:
                     mobile_rows.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_label(
-                                    "❌",
-                                    "FOLD",
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"❌{mobile_sep}FOLD",
                                 callback_data=_callback("fold"),
                             )
                         ]
@@ -1863,10 +1997,13 @@ class LiveMessageManager:
         option_map = {opt.key: opt for opt in options}
         selected_option = option_map.get(selected_key) if selected_key else None
 
-        def _callback(action: str, *payload: str) -> str:
-            return ":".join(
-                ["action", action, *payload, *version_segment, game_id]
-            )
+        # The version/game tail is shared by every button on this keyboard.
+        callback_tail = ":" + ":".join([*version_segment, game_id])
+
+        def _callback(action: str, *extra: str) -> str:
+            if extra:
+                action = ":".join((action, *extra))
+            return "action:" + action + callback_tail
 
         def _button_text(opt: RaiseOptionMeta) -> str:
             text = opt.button_label
@@ -2137,12 +2274,9 @@ class LiveMessageManager:
 
         mention = getattr(player, "mention_markdown", None)
 
-        if mention and mention.startswith("[") and "](" in mention:
-            try:
-                name = mention.split("]")[0][1:]
-                if name:
-                    return name
-            except (IndexError, AttributeError):
-                pass
+        if mention:
+            name = _mention_display_name(mention)
+            if name:
+                return name
 
         return f"User {player.user_id}"
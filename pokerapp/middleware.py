@@ -9,10 +9,10 @@ import logging
 import time
 from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Any, Dict, Deque, Optional
+from typing import Any, Awaitable, Dict, Deque, Optional
 
 from telegram import Update
-from telegram.ext import CallbackContext
+from telegram.ext import BaseUpdateProcessor, CallbackContext
 
 from pokerapp.notify_utils import LoggerHelper
 from pokerapp.entities import MenuContext
@@ -178,6 +178,78 @@ class UserRateLimiter:
         return None
 
 
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Run callback queries in arrival order per chat, concurrently across chats.
+
+    A slow Redis call or Telegram request while handling a button press in
+    one chat only delays later presses in that same chat. Only callback
+    queries are serialized; messages, commands and every other update are
+    processed immediately, as with PTB's default processor.
+
+    ``process_update`` is ``@final`` upstream and is overridden here so a
+    press waits on its chat lock *before* taking a global slot. That relies
+    on PTB 21.x acquiring the semaphore in ``process_update`` around
+    ``do_process_update``; tests/test_middleware.py pins this contract and
+    fails on an upgrade that changes it.
+    """
+
+    def __init__(self, max_concurrent_updates: int) -> None:
+        super().__init__(max_concurrent_updates)
+        self._chat_locks: Dict[int, asyncio.Lock] = {}
+        self._chat_pending: Dict[int, int] = {}
+
+    @staticmethod
+    def _chat_key(update: object) -> Optional[int]:
+        if getattr(update, "callback_query", None) is None:
+            return None
+        chat = getattr(update, "effective_chat", None)
+        return getattr(chat, "id", None)
+
+    async def process_update(  # type: ignore[misc]
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        # PTB takes the global concurrency slot before do_process_update.
+        # Queue on the chat lock first instead, so presses waiting behind a
+        # busy chat don't hold slots every other chat needs.
+        chat_id = self._chat_key(update)
+        if chat_id is None:
+            await super().process_update(update, coroutine)
+            return
+
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        self._chat_pending[chat_id] = self._chat_pending.get(chat_id, 0) + 1
+
+        try:
+            async with lock:
+                await super().process_update(update, coroutine)
+        finally:
+            remaining = self._chat_pending[chat_id] - 1
+            if remaining:
+                self._chat_pending[chat_id] = remaining
+            else:
+                # Drop idle chats so the lock table stays bounded.
+                del self._chat_pending[chat_id]
+                self._chat_locks.pop(chat_id, None)
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        await coroutine
+
+    async def initialize(self) -> None:
+        """Nothing to set up; locks are created lazily per chat."""
+
+    async def shutdown(self) -> None:
+        self._chat_locks.clear()
+        self._chat_pending.clear()
+
+
 class PokerBotMiddleware:
     """Resolve per-chat menu context for rendering dynamic menus."""
 
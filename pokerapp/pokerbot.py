@@ -15,7 +15,11 @@ from telegram.ext import (
 )
 
 from pokerapp.config import Config
-from pokerapp.middleware import AnalyticsMiddleware, UserRateLimiter
+from pokerapp.middleware import (
+    AnalyticsMiddleware,
+    ChatOrderedUpdateProcessor,
+    UserRateLimiter,
+)
 from pokerapp.notify_utils import LoggerHelper
 from pokerapp.pokerbotcontrol import PokerBotController
 from pokerapp.pokerbotmodel import PokerBotModel
@@ -62,17 +66,24 @@ class PokerBot:
             .pool_timeout(cfg.POOL_TIMEOUT)
             .read_timeout(cfg.READ_TIMEOUT)
             .write_timeout(cfg.WRITE_TIMEOUT)
-            .concurrent_updates(cfg.CONCURRENT_UPDATES)
+            .connection_pool_size(cfg.CONNECTION_POOL_SIZE)
+            .http_version(cfg.HTTP_VERSION)
+            .get_updates_connection_pool_size(cfg.GET_UPDATES_POOL_SIZE)
+            .concurrent_updates(
+                ChatOrderedUpdateProcessor(cfg.CONCURRENT_UPDATES)
+            )
             .build()
         )
 
-        redis_backend = redis.Redis(
+        self._kv_pool = redis.ConnectionPool(
             host=cfg.REDIS_HOST,
             port=cfg.REDIS_PORT,
             db=cfg.REDIS_DB,
             password=cfg.REDIS_PASS or None,
-            decode_responses=False,
+            decode_responses=True,
+            max_connections=cfg.REDIS_MAX_CONNECTIONS,
         )
+        redis_backend = redis.Redis(connection_pool=self._kv_pool)
         self._kv = ensure_kv(redis_backend)
 
         translation_manager.attach_kvstore(self._kv)
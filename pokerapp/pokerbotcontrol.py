@@ -39,6 +39,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 log_helper = LoggerHelper.for_logger(logger)
 
+# Callback verbs of the pre-live-message action keyboard
+LEGACY_ACTIONS = {
+    "check": PlayerAction.CHECK,
+    "call": PlayerAction.CALL,
+    "fold": PlayerAction.FOLD,
+    "raise": PlayerAction.RAISE_RATE,
+    "all_in": PlayerAction.ALL_IN,
+}
+
 
 class ControllerTextKeys:
     FOLD_CONFIRM_PROMPT = "popup.toast.fold_prompt"
@@ -2808,15 +2817,7 @@ class PokerBotController:
                     raise_amount=raise_amount,
                 )
             else:
-                legacy_map = {
-                    "check": PlayerAction.CHECK,
-                    "call": PlayerAction.CALL,
-                    "fold": PlayerAction.FOLD,
-                    "raise": PlayerAction.RAISE_RATE,
-                    "all_in": PlayerAction.ALL_IN,
-                }
-
-                player_action = legacy_map.get(action_type)
+                player_action = LEGACY_ACTIONS.get(action_type)
 
                 if player_action is None:
                     await self._respond_to_query(
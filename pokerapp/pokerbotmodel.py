@@ -6,10 +6,23 @@ from datetime import datetime as dt
 import json
 import logging
 import secrets
-from collections import defaultdict
+import time
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+import orjson
 import redis
 from telegram import Bot, ReplyKeyboardMarkup, Update
 from telegram.error import TelegramError
@@ -43,7 +56,11 @@ from pokerapp.pokerbotview import PokerBotViewer
 from pokerapp.live_message import UnicodeTextFormatter
 from pokerapp.kvstore import ensure_kv
 from pokerapp.winnerdetermination import get_combination_name
-from pokerapp.request_cache import RequestCache
+from pokerapp.request_cache import (
+    RequestCache,
+    current_request_cache,
+    detached_context,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -53,6 +70,9 @@ DICE_MULT = 10
 DICE_DELAY_SEC = 5
 BONUSES = (5, 20, 40, 80, 160, 320)
 DICES = "⚀⚁⚂⚃⚄⚅"
+# On Saturdays /bonus rolls the slot machine instead of a die
+SATURDAY = 5
+SLOT_BONUS_MULTIPLIER = 20
 
 KEY_CHAT_DATA_GAME = "game"
 KEY_OLD_PLAYERS = "old_players"
@@ -65,6 +85,24 @@ ONE_DAY = 86400
 DEFAULT_MONEY = 1000
 MAX_TIME_FOR_TURN = datetime.timedelta(minutes=2)
 DESCRIPTION_FILE = "assets/description_bot.md"
+PRIVATE_GAME_CACHE_TTL = 30
+# Parsed lobbies kept before the oldest is evicted
+PRIVATE_GAME_CACHE_SIZE = 256
+# Seconds a get_chat_member reply is reused before asking Telegram again
+CHAT_MEMBER_CACHE_TTL = 30
+# (chat, user) membership replies kept before the oldest is evicted
+CHAT_MEMBER_CACHE_SIZE = 1024
+# Seconds a chat's administrator id set is trusted by _check_access
+CHAT_ADMINS_CACHE_TTL = 90
+# Chats whose administrator ids are kept before the oldest is evicted
+CHAT_ADMINS_CACHE_SIZE = 256
+# Player action announcements arriving within this window share a message
+ACTION_LOG_FLUSH_DELAY = 0.3
+# Per-user wallet instances kept before the least recently used is dropped
+WALLET_CACHE_SIZE = 1024
+TELEGRAM_MESSAGE_LIMIT = 4096
+# Private hand messages in flight at once (Telegram allows ~30 msg/s)
+PRIVATE_SEND_CONCURRENCY = 30
 
 
 class ModelTextKeys:
@@ -124,7 +162,30 @@ class PokerBotModel:
 
         self._readyMessages = {}
         self._username_cache: Dict[int, str] = {}
-        self._request_cache = None  # Per-request cache instance
+        self._background_tasks: Set[asyncio.Task] = set()
+        # game_code -> (expires_at, PrivateGame) for lobby status lookups
+        self._private_game_cache: OrderedDict[
+            str, Tuple[float, Any]
+        ] = OrderedDict()
+        # (chat_id, user_id) -> (expires_at, ChatMember)
+        self._chat_member_cache: OrderedDict[
+            Tuple[int, int], Tuple[float, Any]
+        ] = OrderedDict()
+        # chat_id -> (expires_at, administrator user ids)
+        self._admins_cache: OrderedDict[
+            int, Tuple[float, Set[int]]
+        ] = OrderedDict()
+        self._help_text = self._load_help_text()
+        # chat_id -> action announcements waiting for the next flush
+        self._action_buf: Dict[ChatId, List[str]] = {}
+        # chat_id -> (pending flush task, event that cuts its delay short)
+        self._action_flush: Dict[
+            ChatId, Tuple[asyncio.Task, asyncio.Event]
+        ] = {}
+        self._send_sem = asyncio.Semaphore(PRIVATE_SEND_CONCURRENCY)
+        # Wallets are stateless views over Redis keys; building one costs a
+        # SETNX round trip, so recent users keep a single instance.
+        self._wallets: OrderedDict[int, "WalletManagerModel"] = OrderedDict()
 
         self._lobby_manager = GroupLobbyManager(
             bot=self._bot,
@@ -132,19 +193,146 @@ class PokerBotModel:
             logger=self._logger,
         )
 
-    def _get_or_create_cache(self) -> RequestCache:
-        """Get or create request-scoped cache."""
+    def _fire_and_forget(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        description: str,
+    ) -> asyncio.Task:
+        """Schedule *coro* without awaiting it, logging any failure."""
+
+        task = asyncio.create_task(coro, context=detached_context())
+        self._background_tasks.add(task)
+
+        def _on_done(finished: asyncio.Task) -> None:
+            self._background_tasks.discard(finished)
+            if finished.cancelled():
+                return
+            exc = finished.exception()
+            if exc is not None:
+                logger.warning("Background task %s failed: %s", description, exc)
+
+        task.add_done_callback(_on_done)
+        return task
+
+    def _queue_action_message(self, chat_id: ChatId, text: str) -> None:
+        """Buffer an action announcement and schedule a batched send."""
+
+        self._action_buf.setdefault(chat_id, []).append(text)
+        if chat_id not in self._action_flush:
+            wake = asyncio.Event()
+            task = self._fire_and_forget(
+                self._flush_action_messages(chat_id, wake),
+                "action log flush",
+            )
+            self._action_flush[chat_id] = (task, wake)
+
+    async def _flush_action_messages(
+        self, chat_id: ChatId, wake: asyncio.Event
+    ) -> None:
+        try:
+            try:
+                await asyncio.wait_for(wake.wait(), ACTION_LOG_FLUSH_DELAY)
+            except asyncio.TimeoutError:
+                pass
+            # Lines queued while a chunk is in flight ride the same task.
+            while self._action_buf.get(chat_id):
+                await self._send_action_messages(chat_id)
+        finally:
+            self._action_flush.pop(chat_id, None)
+
+    async def _drain_action_messages(self, chat_id: ChatId) -> None:
+        """Wait until every buffered announcement for *chat_id* is sent.
+
+        Street changes and showdowns await this first so the last actions
+        of a round are never posted after the board or the results.
+        """
+
+        pending = self._action_flush.get(chat_id)
+        if pending is None:
+            return
+        task, wake = pending
+        wake.set()
+        await asyncio.wait([task])
+
+    async def _send_action_messages(self, chat_id: ChatId) -> None:
+        lines = self._action_buf.pop(chat_id, [])
+
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        size = 0
+        for line in lines:
+            if chunk and size + len(line) + 1 > TELEGRAM_MESSAGE_LIMIT:
+                chunks.append(chunk)
+                chunk, size = [], 0
+            chunk.append(line)
+            size += len(line) + 1
+        if chunk:
+            chunks.append(chunk)
+
+        for chunk in chunks:
+            try:
+                await self._view.send_message(
+                    chat_id=chat_id, text="\n".join(chunk)
+                )
+            except TelegramError as exc:
+                # The action log is cosmetic; never let it stall the hand.
+                logger.warning(
+                    "Failed to send action log to chat %s: %s", chat_id, exc
+                )
+
+    def _get_cached_private_game(self, game_code: str) -> Optional[Any]:
+        """Return the parsed lobby for *game_code* if cached and fresh."""
+
+        entry = self._private_game_cache.get(game_code)
+        if entry is None:
+            return None
+
+        expires_at, private_game = entry
+        if expires_at < time.monotonic():
+            del self._private_game_cache[game_code]
+            return None
+        return private_game
+
+    def _cache_private_game(self, game_code: str, private_game: Any) -> None:
+        now = time.monotonic()
+        cache = self._private_game_cache
+        cache[game_code] = (now + PRIVATE_GAME_CACHE_TTL, private_game)
+        cache.move_to_end(game_code)
+
+        # One TTL for every entry keeps the front the first to expire, so
+        # finished lobbies are dropped here even if never looked up again.
+        while cache:
+            oldest = next(iter(cache))
+            full = len(cache) > PRIVATE_GAME_CACHE_SIZE
+            if not full and cache[oldest][0] >= now:
+                break
+            del cache[oldest]
+
+    def _invalidate_private_game(self, game_code: Optional[str]) -> None:
+        """Drop cached lobby state after ``private_game:{code}`` changes."""
+
+        if game_code:
+            self._private_game_cache.pop(str(game_code), None)
 
-        if self._request_cache is None:
-            self._request_cache = RequestCache()
-        return self._request_cache
+    async def _get_chat_member(self, chat_id: ChatId, user_id: UserId) -> Any:
+        """Return ``bot.get_chat_member`` reusing replies younger than the TTL."""
 
-    def _clear_request_cache(self) -> None:
-        """Clear and log request cache statistics."""
+        key = (int(chat_id), int(user_id))
+        entry = self._chat_member_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] >= now:
+            return entry[1]
 
-        if self._request_cache is not None:
-            self._request_cache.log_stats("ActionHandler")
-            self._request_cache = None
+        member = await self._bot.get_chat_member(chat_id, user_id)
+        self._chat_member_cache[key] = (now + CHAT_MEMBER_CACHE_TTL, member)
+        # Entries are refreshed on write, so the front is always the oldest.
+        self._chat_member_cache.move_to_end(key)
+        if len(self._chat_member_cache) > CHAT_MEMBER_CACHE_SIZE:
+            self._chat_member_cache.popitem(last=False)
+        return member
+
+    def _invalidate_chat_member(self, chat_id: ChatId, user_id: UserId) -> None:
+        self._chat_member_cache.pop((int(chat_id), int(user_id)), None)
 
     def _translate(
         self,
@@ -335,12 +523,6 @@ class PokerBotModel:
         key = "username:" + username.lstrip("@").lower()
         user_id = self._kv.get(key)
 
-        if isinstance(user_id, bytes):
-            try:
-                user_id = user_id.decode("utf-8")
-            except Exception:
-                return None
-
         return int(user_id) if user_id else None
 
     async def _send_response(
@@ -375,6 +557,12 @@ class PokerBotModel:
 
         return MIN_PLAYERS
 
+    @staticmethod
+    def _lobby_members_key(chat_id: ChatId) -> str:
+        """Redis set of user ids seated in the lobby hosted in *chat_id*."""
+
+        return ":".join(["game", str(chat_id), "members"])
+
     @staticmethod
     def _game_from_context(context: ContextTypes.DEFAULT_TYPE) -> Game:
         if KEY_CHAT_DATA_GAME not in context.chat_data:
@@ -433,9 +621,6 @@ class PokerBotModel:
         user_game_key = ":".join(["user", str(user_id), "private_game"])
         raw_value = self._kv.get(user_game_key)
 
-        if isinstance(raw_value, bytes):
-            raw_value = raw_value.decode("utf-8")
-
         if not raw_value:
             return None
 
@@ -459,9 +644,6 @@ class PokerBotModel:
             game_key = ":".join(["private_game", game_code])
             game_json = self._kv.get(game_key)
 
-            if isinstance(game_json, bytes):
-                game_json = game_json.decode("utf-8")
-
             if game_json:
                 try:
                     from pokerapp.private_game import PrivateGame
@@ -639,7 +821,7 @@ class PokerBotModel:
                     else:
                         mention = mention_clean
 
-                    cards_str = " ".join(str(card) for card in hand_cards[:5])
+                    cards_str = " ".join(hand_cards[:5])
 
                     lines.append(f"• {mention}")
                     if cards_str:
@@ -683,10 +865,11 @@ class PokerBotModel:
         finally:
             try:
                 chat_key = int(chat_id)
-                chat_data = self._application.chat_data.get(chat_key, {})
-                if KEY_CHAT_DATA_GAME in chat_data:
+                chat_data = self._application.chat_data.get(chat_key)
+                if chat_data and KEY_CHAT_DATA_GAME in chat_data:
                     del chat_data[KEY_CHAT_DATA_GAME]
                     logger.debug("Cleared game state for chat %s", chat_id)
+                self._kv.delete(self._lobby_members_key(chat_key))
             except Exception as cleanup_exc:
                 logger.error(
                     "Failed to cleanup game state for chat %s: %s",
@@ -699,7 +882,17 @@ class PokerBotModel:
         return len(game.players) < MAX_PLAYERS
 
     def _get_wallet(self, user_id: UserId) -> 'WalletManagerModel':
-        return WalletManagerModel(user_id, self._kv)
+        key = int(user_id)
+        wallet = self._wallets.get(key)
+        if wallet is not None:
+            self._wallets.move_to_end(key)
+            return wallet
+
+        wallet = WalletManagerModel(user_id, self._kv)
+        self._wallets[key] = wallet
+        if len(self._wallets) > WALLET_CACHE_SIZE:
+            self._wallets.popitem(last=False)
+        return wallet
 
     @staticmethod
     def _current_turn_player(game: Game) -> Player:
@@ -782,11 +975,11 @@ class PokerBotModel:
                 )
                 return
 
-            wallet = WalletManagerModel(user.id, self._kv)
+            wallet = self._get_wallet(user.id)
 
             if not BalanceValidator.can_afford_table(
                 balance=wallet.value(),
-                stake_config=STAKE_PRESETS[self._cfg.DEFAULT_STAKE_LEVEL],
+                stake_config=self._stake_config,
             ):
                 await self._view.send_message_reply(
                     chat_id=chat_id,
@@ -836,6 +1029,7 @@ class PokerBotModel:
         game = self._game_from_context(context)
         game.ready_users.discard(user_id)
         game.players = [p for p in game.players if p.user_id != user_id]
+        self._invalidate_chat_member(chat_id, user_id)
 
         await self._lobby_manager.remove_player(chat_id, user_id)
 
@@ -922,11 +1116,11 @@ class PokerBotModel:
                 )
                 balance_ok = BalanceValidator.can_afford_table(
                     balance=wallet.value(),
-                    stake_config=STAKE_PRESETS[self._cfg.DEFAULT_STAKE_LEVEL],
+                    stake_config=self._stake_config,
                 )
 
                 try:
-                    member = await self._bot.get_chat_member(chat_id, user_id)
+                    member = await self._get_chat_member(chat_id, user_id)
                     member_user = getattr(member, "user", None)
                 except Exception as exc:  # pragma: no cover - Telegram API
                     self._logger.error(
@@ -1001,6 +1195,16 @@ class PokerBotModel:
         finally:
             cache.log_stats("GroupGameStart")
 
+    @staticmethod
+    def _load_help_text() -> Optional[str]:
+        """Read the help description once; ``None`` selects the fallback."""
+
+        try:
+            with open(DESCRIPTION_FILE, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
     async def show_help(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -1008,10 +1212,8 @@ class PokerBotModel:
         user_id = getattr(update.effective_user, "id", None)
 
         chat_id = update.effective_message.chat_id
-        try:
-            with open(DESCRIPTION_FILE, 'r', encoding='utf-8') as f:
-                text = f.read()
-        except FileNotFoundError:
+        text = self._help_text
+        if text is None:
             text = self._translate(
                 "help.model.fallback",
                 user_id=user_id,
@@ -1029,7 +1231,9 @@ class PokerBotModel:
         game: Game,
         chat_id: ChatId
     ) -> None:
-        print(f"new game: {game.id}, players count: {len(game.players)}")
+        logger.info(
+            "New game %s with %d players", game.id, len(game.players)
+        )
 
         language_context = getattr(self._view, "language_context", None)
         active_lang = getattr(
@@ -1054,13 +1258,8 @@ class PokerBotModel:
         old_players_ids = context.chat_data.get(KEY_OLD_PLAYERS, [])
         old_players_ids = old_players_ids[-1:] + old_players_ids[:-1]
 
-        def index(ln: List, obj) -> int:
-            try:
-                return ln.index(obj)
-            except ValueError:
-                return -1
-
-        game.players.sort(key=lambda p: index(old_players_ids, p.user_id))
+        seat_order = {uid: i for i, uid in enumerate(old_players_ids)}
+        game.players.sort(key=lambda p: seat_order.get(p.user_id, -1))
 
         game.state = GameState.ROUND_PRE_FLOP
         await self._coordinator.register_webapp_game(game.id, int(chat_id), game)
@@ -1092,14 +1291,13 @@ class PokerBotModel:
         user_language = self._apply_user_language(update)
         user_id = getattr(update.effective_user, "id", None)
 
-        wallet = WalletManagerModel(
-            update.effective_message.from_user.id, self._kv)
-        money = wallet.value()
+        wallet = self._get_wallet(update.effective_message.from_user.id)
+        money, claimed = wallet.snapshot()
 
         chat_id = update.effective_message.chat_id
         message_id = update.effective_message.message_id
 
-        if wallet.has_daily_bonus():
+        if claimed:
             await self._view.send_message_reply(
                 chat_id=chat_id,
                 message_id=message_id,
@@ -1112,15 +1310,14 @@ class PokerBotModel:
             )
             return
 
-        SATURDAY = 5
-        if dt.today().weekday() == SATURDAY:
+        if datetime.date.today().weekday() == SATURDAY:
             dice_msg = await self._view.send_dice_reply(
                 chat_id=chat_id,
                 message_id=message_id,
                 emoji='🎰'
             )
             icon = '🎰'
-            bonus_amount = dice_msg.dice.value * 20
+            bonus_amount = dice_msg.dice.value * SLOT_BONUS_MULTIPLIER
         else:
             dice_msg = await self._view.send_dice_reply(
                 chat_id=chat_id,
@@ -1159,11 +1356,7 @@ class PokerBotModel:
 
         game = self._game_from_context(context)
 
-        current_player: Optional[Player] = None
-        for player in game.players:
-            if player.user_id == update.effective_user.id:
-                current_player = player
-                break
+        current_player = game.players_by_id.get(update.effective_user.id)
 
         if current_player is None or not current_player.cards:
             return
@@ -1178,11 +1371,19 @@ class PokerBotModel:
         )
 
     async def _check_access(self, chat_id: ChatId, user_id: UserId) -> bool:
-        chat_admins = await self._bot.get_chat_administrators(chat_id)
-        for m in chat_admins:
-            if m.user.id == user_id:
-                return True
-        return False
+        entry = self._admins_cache.get(int(chat_id))
+        now = time.monotonic()
+        if entry is None or entry[0] < now:
+            chat_admins = await self._bot.get_chat_administrators(chat_id)
+            entry = (
+                now + CHAT_ADMINS_CACHE_TTL,
+                {m.user.id for m in chat_admins},
+            )
+            self._admins_cache[int(chat_id)] = entry
+            self._admins_cache.move_to_end(int(chat_id))
+            if len(self._admins_cache) > CHAT_ADMINS_CACHE_SIZE:
+                self._admins_cache.popitem(last=False)
+        return user_id in entry[1]
 
     async def _send_cards_batch(
         self,
@@ -1191,6 +1392,16 @@ class PokerBotModel:
     ) -> None:
         """Send cards to multiple players concurrently for performance."""
 
+        try:
+            # One MGET up front instead of a GET inside every task.
+            chat_ids = UserPrivateChatModel.get_chat_ids(
+                self._kv,
+                (player.user_id for player in players),
+            )
+        except Exception as exc:
+            logger.warning("Failed to load private chat ids: %s", exc)
+            chat_ids = {}
+
         async def send_to_player(player: Player) -> None:
             private_chat: Optional[UserPrivateChatModel] = None
             private_chat_id: Optional[ChatId] = None
@@ -1201,20 +1412,13 @@ class PokerBotModel:
                     user_id=player.user_id,
                     kv=self._kv,
                 )
-                private_chat_id = private_chat.get_chat_id()
-
-                if isinstance(private_chat_id, bytes):
-                    private_chat_id = private_chat_id.decode('utf-8')
+                private_chat_id = chat_ids.get(player.user_id)
 
                 if private_chat_id:
                     existing_message_id_raw = private_chat.pop_message()
 
                     if existing_message_id_raw is not None:
                         try:
-                            if isinstance(existing_message_id_raw, bytes):
-                                existing_message_id_raw = (
-                                    existing_message_id_raw.decode('utf-8')
-                                )
                             existing_message_id = int(existing_message_id_raw)
                         except (TypeError, ValueError):
                             existing_message_id = None
@@ -1229,15 +1433,16 @@ class PokerBotModel:
             message_id = existing_message_id if private_chat_id else None
 
             try:
-                new_msg_id = await self._view.send_or_update_private_hand(
-                    chat_id=target_chat_id,
-                    cards=player.cards,
-                    mention_markdown=player.mention_markdown,
-                    table_cards=None,
-                    message_id=message_id,
-                    disable_notification=False,
-                    user_id=player.user_id,
-                )
+                async with self._send_sem:
+                    new_msg_id = await self._view.send_or_update_private_hand(
+                        chat_id=target_chat_id,
+                        cards=player.cards,
+                        mention_markdown=player.mention_markdown,
+                        table_cards=None,
+                        message_id=message_id,
+                        disable_notification=False,
+                        user_id=player.user_id,
+                    )
             except Exception as exc:
                 logger.warning(
                     "Failed to send cards privately to %s: %s",
@@ -1276,11 +1481,14 @@ class PokerBotModel:
 
         deck = get_shuffled_deck()
 
-        for player in game.players:
-            player.cards.clear()
-            for _ in range(2):
-                if deck:
-                    player.cards.append(deck.pop())
+        # Take every hole card in one truncation; reversing keeps the order
+        # the previous pop()-per-card loop dealt in.
+        split = max(len(deck) - 2 * len(game.players), 0)
+        dealt = deck[split:][::-1]
+        del deck[split:]
+
+        for i, player in enumerate(game.players):
+            player.cards[:] = dealt[2 * i:2 * i + 2]
 
         game.deck = deck
         game.remain_cards = deck
@@ -1302,17 +1510,18 @@ class PokerBotModel:
             return
 
         # Destination is likely a CallbackContext; send direct messages.
-        for player in game.players:
+        async def send_direct(player: Player) -> None:
             try:
-                await self._view.send_or_update_private_hand(
-                    chat_id=player.user_id,
-                    cards=player.cards,
-                    table_cards=game.cards_table,
-                    mention_markdown=player.mention_markdown,
-                    disable_notification=False,
-                    footer=f"Table stake: {game.table_stake}",
-                    user_id=player.user_id,
-                )
+                async with self._send_sem:
+                    await self._view.send_or_update_private_hand(
+                        chat_id=player.user_id,
+                        cards=player.cards,
+                        table_cards=game.cards_table,
+                        mention_markdown=player.mention_markdown,
+                        disable_notification=False,
+                        footer=f"Table stake: {game.table_stake}",
+                        user_id=player.user_id,
+                    )
             except Exception as exc:
                 logger.warning(
                     "Failed to send cards to %s: %s",
@@ -1320,6 +1529,8 @@ class PokerBotModel:
                     exc,
                 )
 
+        await asyncio.gather(*(send_direct(player) for player in game.players))
+
     async def _divide_cards(self, game: Game, chat_id: ChatId) -> None:
         self._deal_cards_to_players(game)
 
@@ -1432,49 +1643,72 @@ class PokerBotModel:
         game: Game,
         chat_id: int,
     ) -> None:
-        """Handle transition to next betting round."""
+        """Handle transition to next betting round.
 
-        # Move round bets to pot
-        self._coordinator.commit_round_bets(game)
+        Streets are dealt in a loop until someone has to act or the hand is
+        over, so an all-in run-out refreshes the live message once instead of
+        once per street through nested ``_handle_turn_result`` calls.
+        """
 
-        # Advance street
-        new_state, cards_to_deal = self._coordinator.advance_game_street(game)
+        await self._drain_action_messages(chat_id)
 
-        # If advancing lands on FINISHED, the hand is over and we should
-        # immediately settle the game instead of requesting more actions.
-        if new_state == GameState.FINISHED:
-            await self._finish_game(game, chat_id)
-            return
+        board_changed = False
 
-        # Deal community cards if needed and track count
-        cards_dealt = 0
+        while True:
+            # Move round bets to pot
+            self._coordinator.commit_round_bets(game)
 
-        if cards_to_deal > 0:
-            for _ in range(cards_to_deal):
-                if game.remain_cards:
-                    game.cards_table.append(game.remain_cards.pop())
-                    cards_dealt += 1
+            # Advance street
+            new_state, cards_to_deal = self._coordinator.advance_game_street(
+                game
+            )
 
-        # ✅ FIX: Update live message immediately if cards were dealt
-        # This ensures users see Flop/Turn/River cards as soon as they’re dealt
-        if cards_dealt > 0:
-            if hasattr(self._view, "invalidate_render_cache"):
-                self._view.invalidate_render_cache(game)
-            await self._send_live_manager_update(game, chat_id)
+            # If advancing lands on FINISHED, the hand is over and we should
+            # immediately settle the game instead of requesting more actions.
+            if new_state == GameState.FINISHED:
+                if board_changed:
+                    await self._refresh_board(game, chat_id)
+                await self._finish_game(game, chat_id)
+                return
 
-        # Check if next street needs action
-        turn_result, next_player = self._coordinator.process_game_turn(game)
+            if cards_to_deal > 0:
+                deck = game.remain_cards
+                split = max(len(deck) - cards_to_deal, 0)
+                game.cards_table.extend(reversed(deck[split:]))
+                board_changed = board_changed or split < len(deck)
+                del deck[split:]
+
+            # Check if next street needs action
+            turn_result, next_player = self._coordinator.process_game_turn(
+                game
+            )
+            if turn_result != TurnResult.END_ROUND:
+                break
+
+        if board_changed:
+            if turn_result == TurnResult.CONTINUE_ROUND and next_player:
+                # The turn update below redraws the new board as well.
+                if hasattr(self._view, "invalidate_render_cache"):
+                    self._view.invalidate_render_cache(game)
+            else:
+                await self._refresh_board(game, chat_id)
 
         await self._handle_turn_result(
             game,
             chat_id,
             turn_result,
             next_player,
-            # ✅ FIX: update_live=True highlights the active player while
             # LiveMessageManager debouncing prevents spam
-            update_live=True,  # ✅ CHANGED FROM False TO True
+            update_live=True,
         )
 
+    async def _refresh_board(self, game: Game, chat_id: int) -> None:
+        """Show freshly dealt community cards in the live message."""
+
+        if hasattr(self._view, "invalidate_render_cache"):
+            self._view.invalidate_render_cache(game)
+        await self._send_live_manager_update(game, chat_id)
+
     async def _deal_community_cards(
         self,
         *,
@@ -1510,9 +1744,13 @@ class PokerBotModel:
     async def _finish_game(self, game: Game, chat_id: int) -> None:
         """Finish game using coordinator (REPLACES old _finish)"""
 
-        print(
-            "game finished: "
-            f"{game.id}, players: {len(game.players)}, pot: {game.pot}"
+        await self._drain_action_messages(chat_id)
+
+        logger.info(
+            "Game %s finished: %d players, pot %s",
+            game.id,
+            len(game.players),
+            game.pot,
         )
 
         winners_results = self._coordinator.finish_game_with_winners(game)
@@ -1559,8 +1797,8 @@ class PokerBotModel:
                 return
 
             current_player = self._current_turn_player(game)
-            current_user_id = update.callback_query.from_user.id
-            if str(current_user_id) != str(current_player.user_id):
+            # Player ids are ints, so no str() round trip is needed.
+            if update.callback_query.from_user.id != current_player.user_id:
                 return
 
             try:
@@ -1596,10 +1834,8 @@ class PokerBotModel:
             )
             return
 
-        await self._view.send_message(
-            chat_id=chat_id,
-            text="Time is over!",
-        )
+        # Shares the batched message with the fold announcement below.
+        self._queue_action_message(chat_id, "Time is over!")
         await self.fold(update, context)
 
     async def fold(
@@ -1615,9 +1851,9 @@ class PokerBotModel:
         player_name = self._get_player_name(player)
         game.add_action(f"{player_name} folded")
 
-        await self._view.send_message(
-            chat_id=update.effective_message.chat_id,
-            text=f"{player.mention_markdown} {PlayerAction.FOLD.value}"
+        self._queue_action_message(
+            update.effective_message.chat_id,
+            f"{player.mention_markdown} {PlayerAction.FOLD.value}",
         )
 
         chat_id = update.effective_message.chat_id
@@ -1645,10 +1881,8 @@ class PokerBotModel:
                 await self.all_in(update=update, context=context)
                 return
 
-            mention_markdown = self._current_turn_player(game).mention_markdown
-            await self._view.send_message(
-                chat_id=chat_id,
-                text=f"{mention_markdown} {action}"
+            self._queue_action_message(
+                chat_id, f"{player.mention_markdown} {action}"
             )
             call_amount = self._coordinator.player_call_or_check(game, player)
 
@@ -1689,10 +1923,10 @@ class PokerBotModel:
                 await self.all_in(update=update, context=context)
                 return
 
-            await self._view.send_message(
-                chat_id=chat_id,
-                text=player.mention_markdown +
-                f" {action.value} {raise_bet_rate.value}$"
+            self._queue_action_message(
+                chat_id,
+                player.mention_markdown +
+                f" {action.value} {raise_bet_rate.value}$",
             )
 
             self._coordinator.player_raise_bet(
@@ -1717,9 +1951,9 @@ class PokerBotModel:
         player_name = self._get_player_name(player)
         mention = player.mention_markdown
         amount = self._coordinator.player_all_in(game, player)
-        await self._view.send_message(
-            chat_id=chat_id,
-            text=f"{mention} {PlayerAction.ALL_IN.value} {amount}$"
+        self._queue_action_message(
+            chat_id,
+            f"{mention} {PlayerAction.ALL_IN.value} {amount}$",
         )
         player.state = PlayerState.ALL_IN
         game.add_action(f"{player_name} went ALL-IN (${amount})")
@@ -1911,9 +2145,6 @@ class PokerBotModel:
                 )
             return
 
-        if isinstance(game_data, bytes):
-            game_data = game_data.decode('utf-8')
-
         private_game = PrivateGame.from_json(game_data)
 
         # Check if user is invited
@@ -1978,6 +2209,7 @@ class PokerBotModel:
             private_game.to_json(),
             ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
         )
+        self._invalidate_private_game(game_code)
 
         # Link user to game
         user_game_key = ":".join(["user", str(user.id), "private_game"])
@@ -2074,9 +2306,6 @@ class PokerBotModel:
                 )
             return
 
-        if isinstance(game_data, bytes):
-            game_data = game_data.decode('utf-8')
-
         private_game = PrivateGame.from_json(game_data)
 
         # Check if user is invited
@@ -2098,6 +2327,7 @@ class PokerBotModel:
             private_game.to_json(),
             ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
         )
+        self._invalidate_private_game(game_code)
 
         # Update invitation message
         message = self._translate(
@@ -2123,8 +2353,7 @@ class PokerBotModel:
         """Fetch a user's wallet balance using the wallet manager keys."""
 
         try:
-            wallet = await WalletManagerModel.load(user_id, self._kv, logger)
-            return wallet.value()
+            return self._get_wallet(user_id).value()
         except (ValueError, TypeError, redis.RedisError):
             logger.exception("Failed to load wallet for user %s", user_id)
             return getattr(self._cfg, "INITIAL_MONEY", DEFAULT_MONEY)
@@ -2173,9 +2402,6 @@ class PokerBotModel:
         lobby_key = ":".join(["private_game", game_code])
         game_chat_id = self._kv.get(lobby_key)
 
-        if isinstance(game_chat_id, bytes):
-            game_chat_id = game_chat_id.decode("utf-8")
-
         if not game_chat_id:
             await self._view.send_message_reply(
                 chat_id=chat_id,
@@ -2281,15 +2507,15 @@ class PokerBotModel:
             if username:
                 mention = f"@{username}"
             else:
-                mention = "[{}](tg://user?id={})".format(
-                    escape_markdown(display_name, version=1),
-                    user_id,
+                mention = (
+                    f"[{escape_markdown(display_name, version=1)}]"
+                    f"(tg://user?id={user_id})"
                 )
         except Exception:
             display_name = f"User{user_id}"
-            mention = "[{}](tg://user?id={})".format(
-                escape_markdown(display_name, version=1),
-                user_id,
+            mention = (
+                f"[{escape_markdown(display_name, version=1)}]"
+                f"(tg://user?id={user_id})"
             )
 
         player = Player(
@@ -2302,6 +2528,12 @@ class PokerBotModel:
         game.players.append(player)
 
         self._save_game(game_chat_id, game)
+        # Mirror membership in Redis; re-adding seated ids seeds older lobbies.
+        # The set expires with the lobby so an abandoned one never leaks
+        # its ids into the next lobby hosted in this chat.
+        members_key = self._lobby_members_key(game_chat_id)
+        self._kv.sadd(members_key, *(p.user_id for p in game.players))
+        self._kv.expire(members_key, self._cfg.PRIVATE_GAME_TTL_SECONDS)
 
         user_game_key = ":".join(["user", str(user_id), "private_game"])
         self._kv.set(user_game_key, game_chat_id)
@@ -2320,17 +2552,18 @@ class PokerBotModel:
             message_id=update.effective_message.message_id,
         )
 
-        lobby_text = (
-            f"🎉 {mention} joined the game!\n\n"
-            f"👥 Current players ({len(game.players)}/{MAX_PLAYERS})"
-            ":\n"
+        lobby_lines = [
+            f"🎉 {mention} joined the game!",
+            "",
+            f"👥 Current players ({len(game.players)}/{MAX_PLAYERS}):",
+        ]
+        lobby_lines.extend(
+            f"{idx}. {player_entry.mention_markdown}"
+            + (" 👑 (Host)" if idx == 1 else "")
+            for idx, player_entry in enumerate(game.players, 1)
         )
-
-        for idx, player_entry in enumerate(game.players, 1):
-            lobby_text += f"{idx}. {player_entry.mention_markdown}"
-            if idx == 1:
-                lobby_text += " 👑 (Host)"
-            lobby_text += "\n"
+        lobby_lines.append("")
+        lobby_text = "\n".join(lobby_lines)
 
         try:
             await self._view.send_message(
@@ -2364,9 +2597,6 @@ class PokerBotModel:
         user_game_key = "user:" + str(user.id) + ":private_game"
         game_code = self._kv.get(user_game_key)
 
-        if isinstance(game_code, bytes):
-            game_code = game_code.decode("utf-8")
-
         if not game_code:
             await self._send_response(
                 update,
@@ -2430,9 +2660,6 @@ class PokerBotModel:
         game_key = "private_game:" + str(game_code)
         game_json = self._kv.get(game_key)
 
-        if isinstance(game_json, bytes):
-            game_json = game_json.decode("utf-8")
-
         if not game_json:
             await self._send_response(
                 update,
@@ -2469,7 +2696,7 @@ class PokerBotModel:
         }
         self._kv.set(
             invite_key,
-            json.dumps(invite_data),
+            orjson.dumps(invite_data),
             ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
         )
 
@@ -2557,16 +2784,10 @@ class PokerBotModel:
             )
             return _log_and_return()
 
-        if isinstance(game_code, bytes):
-            game_code = game_code.decode("utf-8")
-
         # Load game from Redis
         lobby_key = ":".join(["private_game", game_code])
         game_json = self._kv.get(lobby_key)
 
-        if isinstance(game_json, bytes):
-            game_json = game_json.decode("utf-8")
-
         if not game_json:
             await self._send_response(
                 update,
@@ -2735,6 +2956,7 @@ class PokerBotModel:
 
             # Clean up lobby immediately (don't wait for TTL)
             keys_deleted = self._kv.delete(lobby_key)
+            self._invalidate_private_game(game_code)
 
             for pid in accepted_players:
                 user_game_key = ":".join(
@@ -2774,9 +2996,6 @@ class PokerBotModel:
         # Re-fetch lobby to ensure no concurrent modifications
         current_json = self._kv.get(lobby_key)
 
-        if isinstance(current_json, bytes):
-            current_json = current_json.decode("utf-8")
-
         if current_json != game_json:
             logger.warning(
                 "Lobby state changed during validation for game %s "
@@ -2822,7 +3041,7 @@ class PokerBotModel:
 
             # Fallback: Fetch from Telegram API
             try:
-                member = await self._bot.get_chat_member(chat_id, player_id)
+                member = await self._get_chat_member(chat_id, player_id)
                 member_user = getattr(member, "user", None)
                 name = (
                     getattr(member_user, "full_name", None)
@@ -2870,9 +3089,9 @@ class PokerBotModel:
         for player_id, wallet, display_name in zip(
             accepted_players, wallets, player_names
         ):
-            mention = "[{}](tg://user?id={})".format(
-                escape_markdown(display_name, version=1),
-                player_id,
+            mention = (
+                f"[{escape_markdown(display_name, version=1)}]"
+                f"(tg://user?id={player_id})"
             )
 
             players.append(
@@ -2964,6 +3183,7 @@ class PokerBotModel:
 
         # Delete lobby key (game has started, lobby no longer needed)
         keys_deleted += self._kv.delete(lobby_key)
+        self._invalidate_private_game(game_code)
 
         # Delete all player-to-game mappings
         for pid in accepted_players:
@@ -3021,7 +3241,9 @@ class PokerBotModel:
 
         # === STEP 3B: SEND INDIVIDUAL PLAYER NOTIFICATIONS ===
 
-        for player in players:
+        # Independent DMs: overlap the round trips instead of awaiting
+        # each player in turn.
+        async def notify_player(player: Player) -> None:
             try:
                 balance = player.wallet.value()
                 personal_message = (
@@ -3030,10 +3252,11 @@ class PokerBotModel:
                     f"📊 {UnicodeTextFormatter.make_bold('Blinds')}: {small_blind}/{big_blind}\n\n"
                     "Your cards will be dealt shortly. Good luck! 🍀"
                 )
-                await self._view.send_message(
-                    chat_id=player.user_id,
-                    text=personal_message,
-                )
+                async with self._send_sem:
+                    await self._view.send_message(
+                        chat_id=player.user_id,
+                        text=personal_message,
+                    )
                 logger.debug(
                     "Sent start notification to player %s (balance: $%d)",
                     player.user_id,
@@ -3047,6 +3270,8 @@ class PokerBotModel:
                     exc,
                 )
 
+        await asyncio.gather(*(notify_player(player) for player in players))
+
         logger.info(
             "Sent individual start notifications to %d players for game %s",
             len(players),
@@ -3131,6 +3356,7 @@ class PokerBotModel:
 
         This is an idempotent helper that removes:
         - Primary lobby key (private_game:{code})
+        - Lobby membership set (game:{chat_id}:members)
         - User mapping keys (user:{id}:private_game)
         - Pending invite entries (user:{id}:pending_invites set)
 
@@ -3164,9 +3390,6 @@ class PokerBotModel:
         try:
             lobby_json = self._kv.get(lobby_key)
 
-            if isinstance(lobby_json, bytes):
-                lobby_json = lobby_json.decode("utf-8")
-
             if lobby_json:
                 lobby_data = json.loads(lobby_json)
                 player_ids = lobby_data.get("players", [])
@@ -3202,8 +3425,8 @@ class PokerBotModel:
         # Fallback: Check in-memory game state
         if not player_ids:
             try:
-                chat_data = self._application.chat_data.get(chat_id, {})
-                game = chat_data.get(KEY_CHAT_DATA_GAME)
+                chat_data = self._application.chat_data.get(chat_id)
+                game = chat_data.get(KEY_CHAT_DATA_GAME) if chat_data else None
 
                 if game and hasattr(game, "players"):
                     player_ids = [
@@ -3227,6 +3450,8 @@ class PokerBotModel:
 
         keys_deleted = 0
 
+        self._invalidate_private_game(game_code)
+
         try:
             deleted = self._kv.delete(lobby_key)
             keys_deleted += deleted
@@ -3241,6 +3466,16 @@ class PokerBotModel:
                 exc,
             )
 
+        members_key = self._lobby_members_key(chat_id)
+        try:
+            keys_deleted += self._kv.delete(members_key)
+        except Exception as exc:
+            logger.warning(
+                "Failed to delete lobby members %s: %s",
+                members_key,
+                exc,
+            )
+
         # === STEP 3: DELETE USER MAPPING KEYS ===
 
         for player_id in player_ids:
@@ -3379,9 +3614,6 @@ class PokerBotModel:
         invite_key = "invite:" + str(game_code) + ":" + str(user.id)
         invite_json = self._kv.get(invite_key)
 
-        if isinstance(invite_json, bytes):
-            invite_json = invite_json.decode("utf-8")
-
         if not invite_json:
             await query.edit_message_text(
                 self._translate(
@@ -3391,7 +3623,7 @@ class PokerBotModel:
             )
             return
 
-        invite_data = json.loads(invite_json)
+        invite_data = orjson.loads(invite_json)
         status = invite_data.get("status", "pending")
 
         if status != "pending":
@@ -3443,9 +3675,6 @@ class PokerBotModel:
         game_key = "private_game:" + str(game_code)
         game_json = self._kv.get(game_key)
 
-        if isinstance(game_json, bytes):
-            game_json = game_json.decode("utf-8")
-
         if not game_json:
             await query.edit_message_text(
                 self._translate(
@@ -3479,6 +3708,7 @@ class PokerBotModel:
                 game.to_json(),
                 ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
             )
+            self._invalidate_private_game(game_code)
 
         # Link user to game
         user_game_key = "user:" + str(user.id) + ":private_game"
@@ -3492,7 +3722,7 @@ class PokerBotModel:
         invite_data["status"] = "accepted"
         self._kv.set(
             invite_key,
-            json.dumps(invite_data),
+            orjson.dumps(invite_data),
             ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
         )
 
@@ -3571,9 +3801,6 @@ class PokerBotModel:
         invite_key = "invite:" + str(game_code) + ":" + str(user.id)
         invite_json = self._kv.get(invite_key)
 
-        if isinstance(invite_json, bytes):
-            invite_json = invite_json.decode("utf-8")
-
         if not invite_json:
             await query.edit_message_text(
                 self._translate(
@@ -3583,13 +3810,13 @@ class PokerBotModel:
             )
             return
 
-        invite_data = json.loads(invite_json)
+        invite_data = orjson.loads(invite_json)
 
         # Update status
         invite_data["status"] = "declined"
         self._kv.set(
             invite_key,
-            json.dumps(invite_data),
+            orjson.dumps(invite_data),
             ex=self._cfg.PRIVATE_GAME_TTL_SECONDS,
         )
 
@@ -3608,7 +3835,7 @@ class PokerBotModel:
             )
         )
 
-        # Notify host
+        # Notify host without holding up the decliner's callback
         try:
             player_handle = getattr(user, "username", None)
             if player_handle:
@@ -3619,13 +3846,16 @@ class PokerBotModel:
                 )
                 if not player_display:
                     player_display = str(user.id)
-            await self._bot.send_message(
-                chat_id=invite_data["host_id"],
-                text=self._translate(
-                    "msg.private.invite.declined_host",
-                    user_id=invite_data["host_id"],
-                    player=player_display,
+            self._fire_and_forget(
+                self._bot.send_message(
+                    chat_id=invite_data["host_id"],
+                    text=self._translate(
+                        "msg.private.invite.declined_host",
+                        user_id=invite_data["host_id"],
+                        player=player_display,
+                    ),
                 ),
+                "decline notification for host %s" % invite_data["host_id"],
             )
         except Exception:
             pass
@@ -3644,11 +3874,10 @@ class PokerBotModel:
         message = update.effective_message
         reply_to_id = message.message_id if message is not None else None
 
+        # Consume the user -> lobby mapping in one round trip; every exit
+        # below drops it except refusing to leave a running game.
         user_game_key = ":".join(["user", str(user_id), "private_game"])
-        game_chat_id = self._kv.get(user_game_key)
-
-        if isinstance(game_chat_id, bytes):
-            game_chat_id = game_chat_id.decode("utf-8")
+        game_chat_id = self._kv.getdel(user_game_key)
 
         if not game_chat_id:
             await self._send_response(
@@ -3669,7 +3898,6 @@ class PokerBotModel:
                 user_id,
                 game_chat_id,
             )
-            self._kv.delete(user_game_key)
             await self._send_response(
                 update,
                 self._translate(
@@ -3680,8 +3908,8 @@ class PokerBotModel:
             )
             return
 
-        chat_data = self._application.chat_data.get(game_chat_id_int, {})
-        game = chat_data.get(KEY_CHAT_DATA_GAME)
+        chat_data = self._application.chat_data.get(game_chat_id_int)
+        game = chat_data.get(KEY_CHAT_DATA_GAME) if chat_data else None
 
         if game is None:
             logger.warning(
@@ -3690,7 +3918,6 @@ class PokerBotModel:
                 game_chat_id_int,
                 user_id,
             )
-            self._kv.delete(user_game_key)
             await self._send_response(
                 update,
                 self._translate(
@@ -3702,6 +3929,7 @@ class PokerBotModel:
             return
 
         if game.state != GameState.INITIAL:
+            self._kv.set(user_game_key, game_chat_id)
             await self._send_response(
                 update,
                 self._translate(
@@ -3712,17 +3940,17 @@ class PokerBotModel:
             )
             return
 
-        player_entry = next(
-            (
-                p
-                for p in game.players
-                if str(p.user_id) == str(user_id)
-            ),
-            None,
-        )
+        # Membership lives in a Redis set shared by every worker. Lobbies
+        # nobody joined through join_private_game have no set yet and
+        # fall back to the in-memory seat list.
+        members_key = self._lobby_members_key(game_chat_id_int)
+        was_member = self._kv.srem(members_key, user_id)
+        remaining_members = self._kv.scard(members_key)
+        tracked = bool(was_member or remaining_members)
 
-        if player_entry is None:
-            self._kv.delete(user_game_key)
+        player_entry = game.players_by_id.get(user_id)
+
+        if player_entry is None or (tracked and not was_member):
             await self._send_response(
                 update,
                 self._translate(
@@ -3734,27 +3962,25 @@ class PokerBotModel:
             return
 
         player_mention = player_entry.mention_markdown
-        is_host = (
-            bool(game.players)
-            and str(game.players[0].user_id) == str(user_id)
-        )
+        is_host = bool(game.players) and game.players[0].user_id == user_id
 
-        game.players = [
-            p for p in game.players if str(p.user_id) != str(user_id)
-        ]
+        game.players = [p for p in game.players if p.user_id != user_id]
         game.ready_users.discard(user_id)
 
-        self._kv.delete(user_game_key)
+        # Seats are authoritative for emptiness: stale ids left in the set
+        # must not keep a lobby with nobody seated alive.
+        lobby_empty = not game.players or (tracked and remaining_members == 0)
 
-        if not game.players:
+        if lobby_empty:
             self._application.chat_data.pop(game_chat_id_int, None)
             game_key = ":".join(["game", str(game_chat_id_int)])
-            self._kv.delete(game_key)
+            self._kv.delete(game_key, members_key)
 
             game_code = getattr(game, "code", None)
             if game_code:
                 private_game_key = ":".join(["private_game", game_code])
                 self._kv.delete(private_game_key)
+                self._invalidate_private_game(game_code)
 
             logger.info(
                 "User %s left and game %s is now empty. Game deleted.",
@@ -3785,72 +4011,72 @@ class PokerBotModel:
 
         self._save_game(game_chat_id_int, game)
 
-        await self._send_response(
-            update,
-            self._translate(
-                "msg.private.lobby.leave_confirmation",
-                user_id=user_id,
-            ),
-            reply_to_message_id=reply_to_id,
+        # Resolve the language once; every lobby line below reuses it.
+        t = translation_manager.get_translator(
+            translation_manager.resolve_language(user_id=user_id)
         )
 
         lobby_lines = [
-            self._translate(
-                "msg.private.lobby.player_left",
-                user_id=user_id,
-                player=player_mention,
-            )
+            t("msg.private.lobby.player_left", player=player_mention)
         ]
 
         if new_host is not None:
             lobby_lines.append(
-                self._translate(
+                t(
                     "msg.private.lobby.new_host",
-                    user_id=user_id,
                     player=new_host.mention_markdown,
                 )
             )
 
         lobby_lines.append("")
         lobby_lines.append(
-            self._translate(
+            t(
                 "msg.private.lobby.current_players",
-                user_id=user_id,
                 current=len(game.players),
                 max=MAX_PLAYERS,
             )
         )
 
-        host_marker = self._translate(
-            "msg.private.lobby.host_marker",
-            user_id=user_id,
-        )
+        host_marker = t("msg.private.lobby.host_marker")
 
-        for idx, player in enumerate(game.players, 1):
-            marker = host_marker if idx == 1 else ""
-            lobby_lines.append(
-                self._translate(
-                    "msg.private.lobby.player_entry",
-                    user_id=user_id,
-                    index=idx,
-                    player=player.mention_markdown,
-                    host_marker=marker,
-                )
+        lobby_lines.extend(
+            t(
+                "msg.private.lobby.player_entry",
+                index=idx,
+                player=player.mention_markdown,
+                host_marker=host_marker if idx == 1 else "",
             )
+            for idx, player in enumerate(game.players, 1)
+        )
 
         lobby_text = "\n".join(lobby_lines)
 
-        try:
-            await self._view.send_message(
+        # The leaver and the lobby are different chats; notify both at once.
+        leaver_result, lobby_result = await asyncio.gather(
+            self._send_response(
+                update,
+                t("msg.private.lobby.leave_confirmation"),
+                reply_to_message_id=reply_to_id,
+            ),
+            self._view.send_message(
                 chat_id=game_chat_id_int,
                 text=lobby_text,
+            ),
+            return_exceptions=True,
+        )
+
+        if isinstance(leaver_result, Exception):
+            logger.warning(
+                "Failed to confirm leave to user %s: %s",
+                user_id,
+                leaver_result,
             )
-        except Exception as exc:
+        if isinstance(lobby_result, Exception):
             logger.warning(
                 "Failed to notify lobby %s about player %s leaving: %s",
                 game_chat_id_int,
                 user_id,
-                exc,
+                lobby_result,
             )
 
     async def show_private_game_status(
@@ -3875,9 +4101,6 @@ class PokerBotModel:
         user_game_key = ":".join(["user", str(user_id), "private_game"])
         game_code = self._kv.get(user_game_key)
 
-        if isinstance(game_code, bytes):
-            game_code = game_code.decode("utf-8")
-
         if not game_code:
             await self._view.send_message_reply(
                 chat_id=chat.id,
@@ -3886,42 +4109,44 @@ class PokerBotModel:
             )
             return
 
-        game_key = ":".join(["private_game", str(game_code)])
-        game_json = self._kv.get(game_key)
+        private_game = self._get_cached_private_game(str(game_code))
 
-        if isinstance(game_json, bytes):
-            game_json = game_json.decode("utf-8")
+        if private_game is None:
+            game_key = ":".join(["private_game", str(game_code)])
+            game_json = self._kv.get(game_key)
 
-        if not game_json:
-            await self._view.send_message_reply(
-                chat_id=chat.id,
-                message_id=reply_to_id,
-                text=self._translate(
-                    "msg.private.error.status_unavailable",
-                    user_id=user_id,
-                ),
-            )
-            return
+            if not game_json:
+                await self._view.send_message_reply(
+                    chat_id=chat.id,
+                    message_id=reply_to_id,
+                    text=self._translate(
+                        "msg.private.error.status_unavailable",
+                        user_id=user_id,
+                    ),
+                )
+                return
 
-        from pokerapp.private_game import PrivateGame
+            from pokerapp.private_game import PrivateGame
 
-        try:
-            private_game = PrivateGame.from_json(game_json)
-        except Exception as exc:  # pragma: no cover - defensive parsing
-            logger.warning(
-                "Failed to parse private game %s: %s",
-                game_code,
-                exc,
-            )
-            await self._view.send_message_reply(
-                chat_id=chat.id,
-                message_id=reply_to_id,
-                text=self._translate(
-                    "msg.private.error.status_failed",
-                    user_id=user_id,
-                ),
-            )
-            return
+            try:
+                private_game = PrivateGame.from_json(game_json)
+            except Exception as exc:  # pragma: no cover - defensive parsing
+                logger.warning(
+                    "Failed to parse private game %s: %s",
+                    game_code,
+                    exc,
+                )
+                await self._view.send_message_reply(
+                    chat_id=chat.id,
+                    message_id=reply_to_id,
+                    text=self._translate(
+                        "msg.private.error.status_failed",
+                        user_id=user_id,
+                    ),
+                )
+                return
+
+            self._cache_private_game(str(game_code), private_game)
 
         stake_config = self._cfg.PRIVATE_STAKES.get(private_game.stake_level, {})
         stake_name = stake_config.get("name") or private_game.stake_level.title()
@@ -3957,10 +4182,11 @@ class PokerBotModel:
             return name
 
         player_ids = private_game.players or []
-        player_names: List[str] = []
-
-        for player_id in player_ids:
-            player_names.append(await resolve_name(player_id))
+        player_names: List[str] = list(
+            await asyncio.gather(
+                *(resolve_name(player_id) for player_id in player_ids)
+            )
+        )
 
         if private_game.host_user_id == user_id:
             host_name = (
@@ -4018,8 +4244,6 @@ class PokerBotModel:
             if hasattr(self._kv, "smembers"):
                 raw_codes = self._kv.smembers(pending_key) or []
                 for raw_code in raw_codes:
-                    if isinstance(raw_code, bytes):
-                        raw_code = raw_code.decode("utf-8")
                     if raw_code:
                         codes.add(str(raw_code))
         except Exception:
@@ -4027,8 +4251,6 @@ class PokerBotModel:
 
         if not codes:
             fallback_code = self._kv.get(pending_key)
-            if isinstance(fallback_code, bytes):
-                fallback_code = fallback_code.decode("utf-8")
             if fallback_code:
                 codes.add(str(fallback_code))
 
@@ -4054,15 +4276,12 @@ class PokerBotModel:
             invite_key = ":".join(["invite", str(code), str(user_id)])
             invite_data = self._kv.get(invite_key)
 
-            if isinstance(invite_data, bytes):
-                invite_data = invite_data.decode("utf-8")
-
             host_name = ""
             stake_label = ""
 
             if invite_data:
                 try:
-                    parsed = json.loads(invite_data)
+                    parsed = orjson.loads(invite_data)
                     host_name = str(parsed.get("host_name", "")).strip()
                     stake_level = parsed.get("stake_level")
                     stake_config = self._cfg.PRIVATE_STAKES.get(stake_level, {})
@@ -4120,7 +4339,8 @@ class PokerBotModel:
     ) -> PlayerActionValidation:
         """Validate that a player can take an action before processing it."""
 
-        cache = cache or self._get_or_create_cache()
+        if cache is None:
+            cache = RequestCache()
 
         user_id_str = str(user_id)
         chat_id_str = str(chat_id)
@@ -4140,8 +4360,8 @@ class PokerBotModel:
                 ),
             )
 
-        chat_data = self._application.chat_data.get(chat_id_int, {})
-        game = chat_data.get(KEY_CHAT_DATA_GAME)
+        chat_data = self._application.chat_data.get(chat_id_int)
+        game = chat_data.get(KEY_CHAT_DATA_GAME) if chat_data else None
 
         if game:
             cached_game = cache.get_game(game.id)
@@ -4366,10 +4586,29 @@ class PokerBotModel:
         prepared: PreparedPlayerAction,
         cache: Optional[RequestCache] = None,
     ) -> bool:
-        """Execute a previously validated player action."""
+        """Execute a previously validated player action.
+
+        Without a caller-supplied *cache* a fresh one is used, so memoized
+        balances never leak into a later request.
+        """
 
-        cache = cache or self._get_or_create_cache()
+        owns_cache = cache is None
+        if cache is None:
+            cache = RequestCache()
 
+        try:
+            with cache.activate():
+                return await self._execute_prepared_action(prepared, cache)
+        finally:
+            if owns_cache:
+                cache.log_stats("ActionHandler")
+                cache.clear()
+
+    async def _execute_prepared_action(
+        self,
+        prepared: PreparedPlayerAction,
+        cache: RequestCache,
+    ) -> bool:
         cached_game = cache.get_game(prepared.game.id)
         if cached_game is not None:
             game = cached_game
@@ -4518,7 +4757,7 @@ class PokerBotModel:
     ) -> bool:
         """Backwards-compatible wrapper for controller-driven actions."""
 
-        cache = self._get_or_create_cache()
+        cache = RequestCache()
 
         try:
             validation = await self.prepare_player_action(
@@ -4537,7 +4776,8 @@ class PokerBotModel:
                 cache=cache,
             )
         finally:
-            self._clear_request_cache()
+            cache.log_stats("ActionHandler")
+            cache.clear()
 
 
 class WalletManagerModel(Wallet):
@@ -4545,9 +4785,13 @@ class WalletManagerModel(Wallet):
         self.user_id = user_id
         self._kv = ensure_kv(kv)
 
-        key = self._prefix(self.user_id)
-        if self._kv.get(key) is None:
-            self._kv.set(key, DEFAULT_MONEY)
+        # Atomic bootstrap: one round trip, no GET/SET race between workers.
+        self._kv.setnx(self._prefix(self.user_id), DEFAULT_MONEY)
+
+    @property
+    def kv(self):
+        """Store backing this wallet, for batched reads across wallets."""
+        return self._kv
 
     @classmethod
     async def load(
@@ -4570,8 +4814,17 @@ class WalletManagerModel(Wallet):
     def _prefix(id: int, suffix: str = ""):
         return "pokerbot:" + str(id) + suffix
 
+    # (UTC day number, "dd/mm/yy") shared by every wallet
+    _cached_day: Tuple[int, str] = (-1, "")
+
     def _current_date(self) -> str:
-        return dt.utcnow().strftime("%d/%m/%y")
+        day = int(time.time() // ONE_DAY)
+        cached_day, formatted = WalletManagerModel._cached_day
+        if cached_day != day:
+            d = dt.utcfromtimestamp(day * ONE_DAY)
+            formatted = f"{d.day:02d}/{d.month:02d}/{d.year % 100:02d}"
+            WalletManagerModel._cached_day = (day, formatted)
+        return formatted
 
     def _key_daily(self) -> str:
         return self._prefix(self.user_id, ":daily")
@@ -4580,31 +4833,69 @@ class WalletManagerModel(Wallet):
         current_date = self._current_date()
         last_date = self._kv.get(self._key_daily())
 
-        return last_date is not None and \
-            last_date.decode("utf-8") == current_date
+        return last_date == current_date
+
+    def snapshot(self) -> Tuple[Money, bool]:
+        """ Balance and daily-bonus flag read with a single MGET. """
+        key = self._prefix(self.user_id)
+        raw_balance, last_date = self._kv.mget([key, self._key_daily()])
+
+        balance = int(raw_balance or 0)
+        self._remember_balance(balance)
+        return balance, last_date == self._current_date()
 
     def add_daily(self, amount: Money) -> Money:
-        if self.has_daily_bonus():
+        balance, claimed = self.snapshot()
+        if claimed:
             raise UserException(
                 translation_manager.t(
                     "msg.bonus.already_claimed_plain",
                     user_id=self.user_id,
-                    amount=self.value(),
+                    amount=balance,
                 )
             )
 
         key = self._prefix(self.user_id)
         self._kv.set(self._key_daily(), self._current_date())
 
-        return self._kv.incrby(key, amount)
+        balance = self._kv.incrby(key, amount)
+        self._remember_balance(balance)
+        return balance
+
+    def _balance(self) -> Money:
+        """ Read the balance, at most once per active request cache. """
+        key = self._prefix(self.user_id)
+        cache = current_request_cache()
+        if cache is not None:
+            balance = cache.get_balance(key)
+            if balance is not None:
+                return balance
+
+        raw = self._kv.get(key)
+        if raw is None:
+            # The key was removed after this instance bootstrapped it.
+            self._kv.setnx(key, DEFAULT_MONEY)
+            raw = self._kv.get(key)
+        balance = int(raw or 0)
+        if cache is not None:
+            cache.cache_balance(key, balance)
+        return balance
+
+    def _remember_balance(self, balance: Money) -> None:
+        cache = current_request_cache()
+        if cache is not None:
+            cache.cache_balance(self._prefix(self.user_id), balance)
 
     def inc(self, amount: Money = 0) -> None:
         """ Increase count of money in the wallet.
             Decrease authorized money.
         """
-        wallet = int(self._kv.get(self._prefix(self.user_id)))
+        key = self._prefix(self.user_id)
+        balance = self._kv.incrby(key, amount)
 
-        if wallet + amount < 0:
+        if balance < 0:
+            # Undo the overdraft; INCRBY already told us the new balance.
+            self._remember_balance(self._kv.incrby(key, -amount))
             raise UserException(
                 translation_manager.t(
                     "msg.error.wallet_not_enough",
@@ -4612,7 +4903,7 @@ class WalletManagerModel(Wallet):
                 )
             )
 
-        self._kv.incrby(self._prefix(self.user_id), amount)
+        self._remember_balance(balance)
 
     def inc_authorized_money(
         self,
@@ -4626,23 +4917,52 @@ class WalletManagerModel(Wallet):
         key_authorized_money = self._prefix(self.user_id, ":" + game_id)
         return int(self._kv.get(key_authorized_money) or 0)
 
+    @classmethod
+    def authorized_money_many(
+        cls,
+        kv: Optional[redis.Redis],
+        user_ids: List[UserId],
+        game_id: str,
+    ) -> Dict[UserId, Money]:
+        """ Fetch authorized money of several users with one MGET. """
+        if not user_ids:
+            return {}
+
+        keys = [cls._prefix(uid, ":" + game_id) for uid in user_ids]
+        values = ensure_kv(kv).mget(keys)
+        return {uid: int(v or 0) for uid, v in zip(user_ids, values)}
+
     def authorize(self, game_id: str, amount: Money) -> None:
         """ Decrease count of money. """
-        self.inc_authorized_money(game_id, amount)
+        # Balance check and both transfers run as one atomic script.
+        balance = self._kv.authorize_funds(
+            self._prefix(self.user_id),
+            self._prefix(self.user_id, ":" + game_id),
+            amount,
+        )
+        if balance is None:
+            raise UserException(
+                translation_manager.t(
+                    "msg.error.wallet_not_enough",
+                    user_id=self.user_id,
+                )
+            )
 
-        return self.inc(-amount)
+        self._remember_balance(int(balance))
 
     def authorize_all(self, game_id: str) -> Money:
         """ Decrease all money of player. """
-        money = int(self._kv.get(self._prefix(self.user_id)))
-        self.inc_authorized_money(game_id, money)
+        money = self._kv.authorize_all_funds(
+            self._prefix(self.user_id),
+            self._prefix(self.user_id, ":" + game_id),
+        )
 
-        self._kv.set(self._prefix(self.user_id), 0)
-        return money
+        self._remember_balance(0)
+        return int(money)
 
     def value(self) -> Money:
         """ Get count of money in the wallet. """
-        return int(self._kv.get(self._prefix(self.user_id)))
+        return self._balance()
 
     def approve(self, game_id: str) -> None:
         key_authorized_money = self._prefix(self.user_id, ":" + game_id)
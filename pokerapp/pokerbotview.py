@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 
 import logging
+from collections import OrderedDict
 from functools import lru_cache
+from itertools import zip_longest
 
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from telegram import (
     Message,
@@ -27,7 +29,7 @@ from pokerapp.entities import (
     Mention,
     MenuContext,
 )
-from pokerapp.device_detector import DeviceProfile, DeviceType
+from pokerapp.device_detector import DeviceDetector, DeviceProfile, DeviceType
 from pokerapp.i18n import LanguageContext, translation_manager
 from pokerapp.kvstore import RedisKVStore, ensure_kv
 from pokerapp.live_message import (
@@ -45,6 +47,76 @@ from .menu_state import MenuLocation, get_breadcrumb_path, MENU_HIERARCHY
 
 logger = logging.getLogger(__name__)
 
+STAKE_OPTION_KEYS = ("micro", "low", "medium", "high", "premium")
+
+
+@lru_cache(maxsize=None)
+def _stake_selection_markup(language: str) -> InlineKeyboardMarkup:
+    """Stake menu keyboard; it only varies with the language, so build once."""
+
+    def button(key: str, callback_data: str) -> List[InlineKeyboardButton]:
+        return [
+            InlineKeyboardButton(
+                text=translation_manager.t(key, lang=language),
+                callback_data=callback_data,
+            )
+        ]
+
+    keyboard = [
+        button(f"private.stake_menu.button.{option}", f"stake:{option}")
+        for option in STAKE_OPTION_KEYS
+    ]
+    keyboard.append(button("private.stake_menu.button.language", "stake:language"))
+    keyboard.append(button("private.stake_menu.button.cancel", "stake:cancel"))
+    return InlineKeyboardMarkup(keyboard)
+
+
+@lru_cache(maxsize=None)
+def _stake_selection_text(language: str) -> str:
+    """Stake menu body; it has no per-user fields, so render once."""
+
+    def t(key: str, **kwargs: Any) -> str:
+        return translation_manager.t(key, lang=language, **kwargs)
+
+    options_block = "\n".join(
+        t(f"msg.private.stake_menu.option_{option}")
+        for option in STAKE_OPTION_KEYS
+    )
+    text = t(
+        "msg.private.stake_menu.body",
+        title=t("msg.private.stake_menu.title"),
+        subtitle=t("msg.private.stake_menu.subtitle"),
+        options=options_block,
+        footer=t("msg.private.stake_menu.footer"),
+    )
+    return UnicodeTextFormatter.strip_all_html(text)
+
+
+@lru_cache(maxsize=64)
+def _stake_amounts(
+    language: str,
+    small_blind: int,
+    big_blind: int,
+    min_buyin: int,
+) -> Tuple[str, str, str]:
+    """Blind and buy-in strings; stakes come from a small fixed set."""
+
+    return tuple(
+        translation_manager.format_currency(
+            amount,
+            language=language,
+            currency_symbol="",
+        )
+        for amount in (small_blind, big_blind, min_buyin)
+    )
+
+
+@lru_cache(maxsize=64)
+def _render_player_list(names: Tuple[str, ...]) -> str:
+    """Bullet list for the lobby; re-renders between joins hit the cache."""
+
+    return "\n".join(f" • {name}" for name in names)
+
 
 class ViewerTextKeys:
     HAND_HEADER = "viewer.hand.header"
@@ -58,6 +130,8 @@ class ViewerTextKeys:
 
 
 class PokerBotViewer:
+    DELETED_MESSAGES_LIMIT = 10_000
+
     def __init__(
         self,
         bot: Bot,
@@ -90,6 +164,11 @@ class PokerBotViewer:
             direction=self._language_context.direction,
             font=self._language_context.font,
         )
+        # Message ids are never reused within a chat, so once a delete has
+        # gone through any further delete or markup edit is a wasted call.
+        self._deleted_messages: "OrderedDict[Tuple[ChatId, MessageId], None]" = (
+            OrderedDict()
+        )
         self._logger.info("🔍 PokerBotViewer initialized with LiveMessageManager")
 
     def _get_language_context_for_user(
@@ -117,10 +196,11 @@ class PokerBotViewer:
     ) -> str:
         """Translate message key for the provided or active user language."""
 
+        # Context codes are already resolved, so skip resolve_language().
         language_context = context or self._language_context
-        return translation_manager.t(
+        return translation_manager.translate(
             key,
-            lang=language_context.code,
+            language=language_context.code,
             **kwargs,
         )
 
@@ -249,10 +329,14 @@ class PokerBotViewer:
         return rank.upper(), suit
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _format_card(card: Card) -> str:
         """
         Format a card with Unicode symbol and suit emoji.
 
+        Cards are plain strings and the deck is fixed, so results are kept
+        in an unbounded cache: a plain dict hit with no LRU bookkeeping.
+
         Args:
             card: Card object with rank and suit
 
@@ -270,7 +354,8 @@ class PokerBotViewer:
         if not cards:
             return ""
 
-        return "  ".join(cls._format_card(card) for card in cards)
+        # map() over the memoized formatter: no generator frame per line.
+        return "  ".join(map(cls._format_card, cards))
 
     @staticmethod
     def _format_board_cards(cards: List[Card]) -> str:
@@ -287,29 +372,6 @@ class PokerBotViewer:
         line = PokerBotViewer._format_cards_line(cards)
         return line if line else "Waiting for flop…"
 
-    @staticmethod
-    def _format_mobile_button_text(
-        emoji: str,
-        text: str,
-        *,
-        emoji_scale: float = 1.5,
-    ) -> str:
-        """Format button text with scaled emoji for mobile readability.
-
-        Args:
-            emoji: Button emoji (e.g., "✅", "💰")
-            text: Button text (e.g., "CHECK", "CALL $50")
-            emoji_scale: Scale multiplier for emoji size
-
-        Returns:
-            Formatted button text with spacing
-        """
-
-        if emoji_scale > 1.0:
-            return f"{emoji}\u200A {text}"
-
-        return f"{emoji} {text}"
-
     def build_hand_panel(
         self,
         hand_cards: Optional[List[Card]] = None,
@@ -321,41 +383,69 @@ class PokerBotViewer:
     ) -> str:
         """Construct the emoji panel used across private and group UIs."""
 
-        language_context = context or self._language_context
+        lang = (context or self._language_context).code
+        indent = PokerBotViewer._HAND_INDENT
+        t = translation_manager.t
         lines: List[str] = []
 
         if hand_cards is not None:
-            lines.append(
-                f"{self._HAND_INDENT}{self._t(ViewerTextKeys.HAND_HEADER, context=language_context)}"
-            )
-            hand_line = self._format_cards_line(hand_cards) or self._t(
+            lines.append(f"{indent}{t(ViewerTextKeys.HAND_HEADER, lang=lang)}")
+            hand_line = self._format_cards_line(hand_cards) or t(
                 ViewerTextKeys.HAND_EMPTY,
-                context=language_context,
+                lang=lang,
             )
-            lines.append(f"{self._HAND_INDENT}{hand_line}")
+            lines.append(f"{indent}{hand_line}")
+
+        table_text = self._render_table_panel(
+            lang,
+            tuple(board_cards or ()),
+            include_table,
+            pot,
+            bool(lines),
+        )
+        if table_text:
+            lines.append(table_text)
+
+        return "\n".join(lines)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _render_table_panel(
+        lang: str,
+        board_cards: Tuple[Card, ...],
+        include_table: bool,
+        pot: Optional[int],
+        after_hand: bool,
+    ) -> str:
+        """Render the board and pot lines, which every seat at a table shares.
+
+        Hole cards are kept out of the key so one entry serves the whole
+        table for each board and pot.
+        """
+
+        indent = PokerBotViewer._HAND_INDENT
+        t = translation_manager.t
+        lines: List[str] = []
 
         if include_table:
-            if lines:
+            if after_hand:
                 lines.append("")
-            lines.append(
-                f"{self._HAND_INDENT}{self._t(ViewerTextKeys.TABLE_HEADER, context=language_context)}"
+            lines.append(f"{indent}{t(ViewerTextKeys.TABLE_HEADER, lang=lang)}")
+            board_line = PokerBotViewer._format_cards_line(board_cards) or t(
+                ViewerTextKeys.TABLE_WAITING,
+                lang=lang,
             )
-            board_line = self._format_cards_line(board_cards or [])
-            if not board_line:
-                board_line = self._t(
-                    ViewerTextKeys.TABLE_WAITING,
-                    context=language_context,
-                )
-            lines.append(f"{self._HAND_INDENT}{board_line}")
+            lines.append(f"{indent}{board_line}")
 
         if pot is not None:
             lines.append("")
-            pot_display = self._format_currency(
+            pot_display = translation_manager.format_currency(
                 pot,
-                context=language_context,
+                language=lang,
+                currency_symbol="$",
             )
             lines.append(
-                f"{self._HAND_INDENT}{self._t(ViewerTextKeys.POT, amount=pot_display, context=language_context)}"
+                f"{indent}{t(ViewerTextKeys.POT, lang=lang, amount=pot_display)}"
             )
 
         return "\n".join(lines)
@@ -393,15 +483,13 @@ class PokerBotViewer:
         """
 
         if device_profile is None:
-            from pokerapp.device_detector import DeviceDetector
-
-            detector = DeviceDetector()
+            # detect_device is a classmethod returning shared profiles.
             chat_type = "private" if getattr(game, "chat_id", 0) > 0 else "group"
-            device_profile = detector.detect_device(chat_type=chat_type)
+            device_profile = DeviceDetector.detect_device(chat_type=chat_type)
 
         is_mobile = device_profile.device_type == DeviceType.MOBILE
-        emoji_scale = getattr(device_profile, "emoji_size_multiplier", 1.0)
-        cache_variant = f"{getattr(device_profile.device_type, 'value', 'default')}:{self._language_context.code}"
+        emoji_scale = device_profile.emoji_size_multiplier
+        cache_variant = f"{device_profile.device_type.value}:{self._language_context.code}"
 
         if self._live_manager is not None:
             markup, _ = self._live_manager._build_action_inline_keyboard(
@@ -427,90 +515,92 @@ class PokerBotViewer:
                     version=version,
                 )
 
-        current_bet = max(game.max_round_rate, 0)
-        player_bet = max(current_player.round_rate, 0)
-        player_balance = max(current_player.wallet.value(), 0)
-        call_amount = max(current_bet - player_bet, 0)
+        # Clamp with conditionals; these run on every keyboard build and a
+        # compare is cheaper than a max() call.
+        current_bet = game.max_round_rate
+        if current_bet < 0:
+            current_bet = 0
+        player_bet = current_player.round_rate
+        if player_bet < 0:
+            player_bet = 0
+        player_balance = current_player.wallet.value()
+        if player_balance < 0:
+            player_balance = 0
+        call_amount = current_bet - player_bet if current_bet > player_bet else 0
 
         game_id_str = str(game.id)
         version_segment = [str(version)] if version is not None else []
 
-        stake_config = getattr(game, "stake_config", None)
-        config_big_blind = getattr(stake_config, "big_blind", 0) if stake_config else 0
-        table_big_blind = (getattr(game, "table_stake", 0) or 0) * 2
+        # Game.reset() always sets these, so read them directly.
+        stake_config = game.stake_config
+        config_big_blind = stake_config.big_blind if stake_config else 0
+        table_big_blind = (game.table_stake or 0) * 2
+        pot_amount = game.pot if game.pot > 0 else 0
         baseline_big_blind = max(config_big_blind, table_big_blind, 20)
         min_raise = max(current_bet * 2, baseline_big_blind)
 
+        # Fold is always offered and all-in whenever chips remain, so the
+        # legal actions reduce to a few flags checked while laying out rows.
+        can_check = call_amount <= 0
+        can_call = not can_check and call_amount < player_balance
         can_raise = player_balance > call_amount and player_balance >= min_raise
+        can_all_in = player_balance > 0
 
-        available_actions: Set[PlayerAction] = {PlayerAction.FOLD}
-        if call_amount <= 0:
-            available_actions.add(PlayerAction.CHECK)
-        elif call_amount < player_balance:
-            available_actions.add(PlayerAction.CALL)
-        elif player_balance > 0:
-            available_actions.add(PlayerAction.ALL_IN)
-
-        if can_raise:
-            available_actions.add(PlayerAction.RAISE_RATE)
-        if player_balance > 0:
-            available_actions.add(PlayerAction.ALL_IN)
+        # The version/game tail is shared by every button on this keyboard.
+        callback_tail = ":" + ":".join([*version_segment, game_id_str])
 
         def _callback(action: str, *extra: str) -> str:
-            return ":".join(["action", action, *extra, *version_segment, game_id_str])
+            if extra:
+                action = ":".join((action, *extra))
+            return "action:" + action + callback_tail
 
         if is_mobile:
+            # Scaled emoji get a hair space so they don't crowd the label.
+            mobile_sep = "\u200A " if emoji_scale > 1.0 else " "
+
             def _build_mobile_buttons() -> List[List[InlineKeyboardButton]]:
                 buttons: List[List[InlineKeyboardButton]] = []
 
-                if PlayerAction.CHECK in available_actions:
+                if can_check:
                     buttons.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_text(
-                                    "✅",
-                                    self._t("action.check"),
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"✅{mobile_sep}{self._t('action.check')}",
                                 callback_data=_callback("check"),
                             )
                         ]
                     )
-                elif PlayerAction.CALL in available_actions:
+                elif can_call:
                     call_amount_display = self._format_currency(call_amount)
                     buttons.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_text(
-                                    "💰",
-                                    f"{self._t('action.call')} {call_amount_display}",
-                                    emoji_scale=emoji_scale,
-                                ),
+                                f"💰{mobile_sep}{self._t('action.call')} {call_amount_display}",
                                 callback_data=_callback("call"),
                             )
                         ]
                     )
 
-                if PlayerAction.RAISE_RATE in available_actions and player_balance > 0:
+                if can_raise:
                     max_raise = player_balance
+                    raise_label = self._t("button.raise")
                     presets: List[Tuple[str, str, int]] = []
 
                     if min_raise <= max_raise:
                         presets.append(
                             (
                                 "📈",
-                                f"{self._t('button.raise')} {self._format_currency(min_raise)}",
+                                f"{raise_label} {self._format_currency(min_raise)}",
                                 min_raise,
                             )
                         )
 
-                    pot_amount = max(getattr(game, "pot", 0), 0)
                     two_pot = pot_amount * 2
                     if min_raise <= two_pot <= max_raise:
                         presets.append(
                             (
                                 "📈",
-                                f"{self._t('button.raise')} 2×{self._format_currency(two_pot)}",
+                                f"{raise_label} 2×{self._format_currency(two_pot)}",
                                 two_pot,
                             )
                         )
@@ -524,56 +614,45 @@ class PokerBotViewer:
                         presets.append(
                             (
                                 "💼",
-                                f"{self._t('button.raise')} ½×{self._format_currency(half_stack)}",
+                                f"{raise_label} ½×{self._format_currency(half_stack)}",
                                 half_stack,
                             )
                         )
 
-                    for i in range(0, len(presets), 2):
-                        chunk = presets[i: i + 2]
-                        row: List[InlineKeyboardButton] = []
-                        for emoji, label, amount in chunk:
-                            row.append(
-                                InlineKeyboardButton(
-                                    self._format_mobile_button_text(
-                                        emoji,
-                                        label,
-                                        emoji_scale=emoji_scale,
-                                    ),
-                                    callback_data=_callback("raise", str(amount)),
-                                )
-                            )
-                        if row:
-                            buttons.append(row)
-
-                if PlayerAction.ALL_IN in available_actions and player_balance > 0:
-                    buttons.append(
+                    preset_buttons = iter(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_text(
-                                    "🔥",
-                                    f"{self._t('button.all_in')} {self._format_currency(player_balance)}",
-                                    emoji_scale=emoji_scale,
-                                ),
-                                callback_data=_callback("all_in"),
+                                f"{emoji}{mobile_sep}{label}",
+                                callback_data=_callback("raise", str(amount)),
                             )
+                            for emoji, label, amount in presets
                         ]
                     )
+                    # Zipping one iterator with itself pairs presets per row.
+                    buttons.extend(
+                        [button for button in pair if button is not None]
+                        for pair in zip_longest(preset_buttons, preset_buttons)
+                    )
 
-                if PlayerAction.FOLD in available_actions:
+                if can_all_in:
                     buttons.append(
                         [
                             InlineKeyboardButton(
-                                self._format_mobile_button_text(
-                                    "❌",
-                                    self._t("action.fold"),
-                                    emoji_scale=emoji_scale,
-                                ),
-                                callback_data=_callback("fold"),
+                                f"🔥{mobile_sep}{self._t('button.all_in')} {self._format_currency(player_balance)}",
+                                callback_data=_callback("all_in"),
                             )
                         ]
                     )
 
+                buttons.append(
+                    [
+                        InlineKeyboardButton(
+                            f"❌{mobile_sep}{self._t('action.fold')}",
+                            callback_data=_callback("fold"),
+                        )
+                    ]
+                )
+
                 return buttons
 
             mobile_buttons = _build_mobile_buttons()
@@ -583,14 +662,14 @@ class PokerBotViewer:
         buttons: List[List[InlineKeyboardButton]] = []
 
         row1: List[InlineKeyboardButton] = []
-        if PlayerAction.CHECK in available_actions:
+        if can_check:
             row1.append(
                 InlineKeyboardButton(
                     self._t("button.check"),
                     callback_data=_callback("check"),
                 )
             )
-        elif PlayerAction.CALL in available_actions:
+        elif can_call:
             call_amount_display = self._format_currency(
                 call_amount,
                 include_symbol=False,
@@ -610,50 +689,27 @@ class PokerBotViewer:
         )
         buttons.append(row1)
 
-        pot_amount = getattr(game, "pot", 0)
-
-        def _format_raise_button(amount: int) -> str:
+        def _raise_button(amount: int) -> InlineKeyboardButton:
             formatted_amount = LiveMessageManager._format_chips(amount, width=4)
-            return f"{self._t('button.raise')} {formatted_amount}"
-
-        raise_amounts: List[int] = []
-        if PlayerAction.RAISE_RATE in available_actions:
-            raise_amounts.append(min_raise)
-            if pot_amount > min_raise and player_balance >= pot_amount:
-                raise_amounts.append(pot_amount)
-
-        if player_balance > 0:
-            row2: List[InlineKeyboardButton] = []
-
-            if PlayerAction.RAISE_RATE in available_actions:
-                row2.append(
-                    InlineKeyboardButton(
-                        _format_raise_button(min_raise),
-                        callback_data=_callback("raise", str(min_raise)),
-                    )
-                )
+            return InlineKeyboardButton(
+                f"{self._t('button.raise')} {formatted_amount}",
+                callback_data=_callback("raise", str(amount)),
+            )
 
+        if can_all_in:
+            row2 = [_raise_button(min_raise)] if can_raise else []
             row2.append(
                 InlineKeyboardButton(
                     f"{self._t('button.all_in')} {LiveMessageManager._format_chips(player_balance, width=4)}",
                     callback_data=_callback("all_in"),
                 )
             )
-
             buttons.append(row2)
 
-        extra_amounts = raise_amounts[1:]
-        if extra_amounts:
-            for i in range(0, len(extra_amounts), 2):
-                row: List[InlineKeyboardButton] = []
-                for amount in extra_amounts[i: i + 2]:
-                    row.append(
-                        InlineKeyboardButton(
-                            _format_raise_button(amount),
-                            callback_data=_callback("raise", str(amount)),
-                        )
-                    )
-                buttons.append(row)
+        # A pot-sized raise only gets its own row when it beats the minimum.
+        if can_raise:
+            if pot_amount > min_raise and player_balance >= pot_amount:
+                buttons.append([_raise_button(pot_amount)])
 
         markup = InlineKeyboardMarkup(buttons)
 
@@ -1594,8 +1650,8 @@ class PokerBotViewer:
         markup = PokerBotViewer._get_cards_markup(cards)
         language_context = self._get_language_context_for_user(user_id=user_id)
         panel_text = self.build_hand_panel(
-            hand_cards=list(cards),
-            board_cards=[],
+            hand_cards=cards,
+            board_cards=None,
             context=language_context,
         )
         message_text = (
@@ -1609,18 +1665,14 @@ class PokerBotViewer:
             context=language_context,
         )
 
-        send_kwargs = dict(
+        await self._bot.send_message(
             chat_id=chat_id,
             text=localized_text,
             reply_markup=markup,
             disable_notification=True,
+            reply_to_message_id=ready_message_id,
         )
 
-        if ready_message_id is not None:
-            send_kwargs["reply_to_message_id"] = ready_message_id
-
-        await self._bot.send_message(**send_kwargs)
-
     async def send_or_update_private_hand(
         self,
         chat_id: ChatId,
@@ -1637,8 +1689,8 @@ class PokerBotViewer:
 
         language_context = self._get_language_context_for_user(user_id=user_id)
         panel_text = self.build_hand_panel(
-            hand_cards=list(cards),
-            board_cards=list(table_cards or []),
+            hand_cards=cards,
+            board_cards=table_cards,
             include_table=True,
             context=language_context,
         )
@@ -1687,6 +1739,8 @@ class PokerBotViewer:
         chat_id: ChatId,
         message_id: MessageId,
     ) -> None:
+        if (chat_id, message_id) in self._deleted_messages:
+            return
         await self._bot.edit_message_reply_markup(
             chat_id=chat_id,
             message_id=message_id,
@@ -1697,10 +1751,16 @@ class PokerBotViewer:
         chat_id: ChatId,
         message_id: MessageId,
     ) -> None:
+        key = (chat_id, message_id)
+        if key in self._deleted_messages:
+            return
         await self._bot.delete_message(
             chat_id=chat_id,
             message_id=message_id,
         )
+        self._deleted_messages[key] = None
+        if len(self._deleted_messages) > self.DELETED_MESSAGES_LIMIT:
+            self._deleted_messages.popitem(last=False)
 
     async def send_stake_selection(
         self,
@@ -1712,74 +1772,16 @@ class PokerBotViewer:
     ) -> None:
         """Send stake selection menu for private game creation."""
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
         language_context = self._get_language_context_for_user(language=language_code)
-        option_keys = ["micro", "low", "medium", "high", "premium"]
 
-        keyboard: List[List[InlineKeyboardButton]] = [
-            [
-                InlineKeyboardButton(
-                    text=self._t(
-                        f"private.stake_menu.button.{option}",
-                        context=language_context,
-                    ),
-                    callback_data=f"stake:{option}",
-                )
-            ]
-            for option in option_keys
-        ]
-
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=self._t(
-                        "private.stake_menu.button.language",
-                        context=language_context,
-                    ),
-                    callback_data="stake:language",
-                )
-            ]
-        )
-        keyboard.append(
-            [
-                InlineKeyboardButton(
-                    text=self._t(
-                        "private.stake_menu.button.cancel",
-                        context=language_context,
-                    ),
-                    callback_data="stake:cancel",
-                )
-            ]
-        )
-
-        options_block = "\n".join(
-            self._t(
-                f"msg.private.stake_menu.option_{option}",
-                context=language_context,
-            )
-            for option in option_keys
-        )
-
-        text = self._t(
-            "msg.private.stake_menu.body",
-            context=language_context,
-            title=self._t("msg.private.stake_menu.title", context=language_context),
-            subtitle=self._t(
-                "msg.private.stake_menu.subtitle", context=language_context
-            ),
-            options=options_block,
-            footer=self._t("msg.private.stake_menu.footer", context=language_context),
-        )
-        plain_text = UnicodeTextFormatter.strip_all_html(text)
-        localized_text = self._localize_text(plain_text, context=language_context)
-        reply_markup = InlineKeyboardMarkup(keyboard)
+        plain_text = _stake_selection_text(language_context.code)
+        reply_markup = _stake_selection_markup(language_context.code)
 
         if message_id is not None:
             await self._bot.edit_message_text(
                 chat_id=chat_id,
                 message_id=message_id,
-                text=localized_text,
+                text=self._localize_text(plain_text, context=language_context),
                 reply_markup=reply_markup,
                 disable_web_page_preview=True,
             )
@@ -1803,8 +1805,6 @@ class PokerBotViewer:
     ) -> None:
         """Send invitation notification in the originating chat."""
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
         language_context = self._language_context
 
         keyboard = [
@@ -1858,10 +1858,8 @@ class PokerBotViewer:
     ) -> None:
         """Send current status of private game lobby."""
 
-        from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-
         language_context = self._language_context
-        player_list = "\n".join([f" • {name}" for name in player_names])
+        player_list = _render_player_list(tuple(player_names))
 
         keyboard = []
         if can_start:
@@ -2066,17 +2064,11 @@ class PokerBotViewer:
             (message_text, keyboard)
         """
 
-        small_blind = self._format_currency(
+        small_blind, big_blind, min_buyin = _stake_amounts(
+            self._language_context.code,
             stake_config["small_blind"],
-            include_symbol=False,
-        )
-        big_blind = self._format_currency(
             stake_config["big_blind"],
-            include_symbol=False,
-        )
-        min_buyin = self._format_currency(
             stake_config["min_buyin"],
-            include_symbol=False,
         )
 
         message = self._t(
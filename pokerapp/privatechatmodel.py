@@ -1,5 +1,5 @@
 from types import NoneType
-from typing import Union
+from typing import Dict, Iterable, Optional, Union
 
 import redis
 
@@ -15,13 +15,31 @@ class UserPrivateChatModel:
         self.user_id = user_id
         self._kv = kv
 
+    @staticmethod
+    def _chat_key(user_id: UserId) -> str:
+        return "pokerbot:chats:" + str(user_id)
+
     @property
     def _key(self) -> str:
-        return "pokerbot:chats:" + str(self.user_id)
+        return self._chat_key(self.user_id)
 
     def get_chat_id(self) -> Union[ChatId, NoneType]:
         return self._kv.get(self._key)
 
+    @classmethod
+    def get_chat_ids(
+        cls,
+        kv: redis.Redis,
+        user_ids: Iterable[UserId],
+    ) -> Dict[UserId, Optional[ChatId]]:
+        """ Private chat ids of several users with one MGET. """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+
+        values = kv.mget([cls._chat_key(uid) for uid in user_ids])
+        return dict(zip(user_ids, values))
+
     def set_chat_id(self, chat_id: ChatId) -> None:
         return self._kv.set(self._key, chat_id)
 
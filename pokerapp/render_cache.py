@@ -66,7 +66,7 @@ class RenderCache:
             str(getattr(current_player, "user_id", "none")),
             str(getattr(game, "pot", 0)),
             str(getattr(game, "max_round_rate", 0)),
-            ",".join(str(card) for card in getattr(game, "cards_table", []) or []),
+            ",".join(getattr(game, "cards_table", []) or []),
         ]
 
         for player in getattr(game, "players", []) or []:
@@ -180,11 +180,13 @@ class RenderCache:
         """Remove cached entries associated with a specific game."""
         key = str(game_id)
         cache_keys = self._keys_by_game.pop(key, set())
-        for cache_key in cache_keys:
-            try:
-                self._kv.delete(cache_key)
-            except Exception:  # pragma: no cover - best-effort cleanup
-                pass
+        if not cache_keys:
+            return
+        # One multi-key DEL instead of a round trip per cached variant.
+        try:
+            self._kv.delete(*cache_keys)
+        except Exception:  # pragma: no cover - best-effort cleanup
+            pass
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache performance metrics."""
@@ -8,11 +8,35 @@ reads without risking stale data.
 """
 
 import logging
+from contextvars import Context, ContextVar, copy_context
 from typing import Dict, Optional, Any
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+_current_cache: ContextVar[Optional["RequestCache"]] = ContextVar(
+    "pokerbot_request_cache",
+    default=None,
+)
+
+
+def current_request_cache() -> Optional["RequestCache"]:
+    """Return the cache activated for the running handler, if any."""
+
+    return _current_cache.get()
+
+
+def detached_context() -> Context:
+    """Copy the current context with no request cache active.
+
+    Tasks spawned from a handler inherit its context; running them in this
+    copy keeps them from reading balances memoized by a finished request.
+    """
+
+    context = copy_context()
+    context.run(_current_cache.set, None)
+    return context
+
 
 class RequestCache:
     """Per-request cache for expensive operations."""
@@ -21,6 +45,7 @@ class RequestCache:
         self._wallets: Dict[int, Any] = {}
         self._games: Dict[str, Any] = {}
         self._usernames: Dict[int, str] = {}
+        self._balances: Dict[str, int] = {}
         self._custom: Dict[str, Any] = {}
         self._hit_count = 0
         self._miss_count = 0
@@ -74,6 +99,17 @@ class RequestCache:
         """
         self._games[game_id] = game
 
+    def get_balance(self, wallet_key: str) -> Optional[int]:
+        if wallet_key in self._balances:
+            self._hit_count += 1
+            return self._balances[wallet_key]
+
+        self._miss_count += 1
+        return None
+
+    def cache_balance(self, wallet_key: str, balance: int) -> None:
+        self._balances[wallet_key] = balance
+
     def get_custom(self, key: str) -> Optional[Any]:
         if key in self._custom:
             self._hit_count += 1
@@ -97,6 +133,7 @@ class RequestCache:
             "wallets_cached": len(self._wallets),
             "usernames_cached": len(self._usernames),
             "games_cached": len(self._games),
+            "balances_cached": len(self._balances),
         }
 
     def log_stats(self, prefix: str = "RequestCache") -> None:
@@ -119,15 +156,31 @@ class RequestCache:
         self._wallets.clear()
         self._games.clear()
         self._usernames.clear()
+        self._balances.clear()
         self._custom.clear()
         self._hit_count = 0
         self._miss_count = 0
 
+    @contextmanager
+    def activate(self):
+        """Expose this cache to callees without an explicit reference.
+
+        Wallet balance reads consult the active cache so repeated
+        ``value()`` calls within one handler hit Redis only once.
+        """
+
+        token = _current_cache.set(self)
+        try:
+            yield self
+        finally:
+            _current_cache.reset(token)
+
 
 @contextmanager
 def request_cache_context():
     cache = RequestCache()
     try:
-        yield cache
+        with cache.activate():
+            yield cache
     finally:
         cache.log_stats()
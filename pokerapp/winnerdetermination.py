@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 
 import enum
+from functools import lru_cache
 from itertools import combinations
 from typing import Dict, List, Tuple
 
@@ -88,72 +89,86 @@ class WinnerDetermination:
         return (hand_values, hand_keys)
 
     def _check_hand_get_score(self, hand: Cards) -> Score:
-        hand_values = sorted(self._make_values(hand))
-        is_single_suit = len(set(self._make_suits(hand))) == 1
+        return self._score_values(
+            tuple(sorted(self._make_values(hand))),
+            len(set(self._make_suits(hand))) == 1,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _score_values(
+        cls,
+        hand_values: Tuple[int, ...],
+        is_single_suit: bool,
+    ) -> Score:
+        """ Score a hand from its sorted card values and flush flag.
 
-        grouped_values, grouped_keys = self._group_hand(hand_values)
+        Only ranks and the flush flag matter, so there are fewer than
+        13k distinct inputs and every one is computed once per process.
+        """
+        grouped_values, grouped_keys = cls._group_hand(hand_values)
 
         delta_pos = hand_values[-1] - hand_values[0]
         is_sequence = (delta_pos == 4) and len(grouped_values) == 5
 
         # ROYAL_FLUSH.
         if len(grouped_keys) == 5 and hand_values[0] == 10 and is_single_suit:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 [], HandsOfPoker.ROYAL_FLUSH
             )
 
         # STRAIGHT_FLUSH.
         elif is_single_suit and is_sequence:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 [hand_values[-1]], HandsOfPoker.STRAIGHT_FLUSH
             )
 
         # FOUR_OF_A_KIND.
         elif grouped_values == [1, 4]:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 grouped_keys, HandsOfPoker.FOUR_OF_A_KIND
             )
 
         # FULL_HOUSE.
         elif grouped_values == [2, 3]:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 grouped_keys, HandsOfPoker.FULL_HOUSE
             )
 
         # FLUSH.
         elif is_single_suit:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 [hand_values[-1]], HandsOfPoker.FLUSH
             )
 
         # STRAIGHTS.
         elif is_sequence:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 [hand_values[-1]], HandsOfPoker.STRAIGHTS
             )
 
         # THREE_OF_A_KIND.
         elif grouped_values == [1, 1, 3]:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 grouped_keys, HandsOfPoker.THREE_OF_A_KIND
             )
 
         # TWO_PAIR.
         elif grouped_values == [1, 2, 2]:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 grouped_keys, HandsOfPoker.TWO_PAIR
             )
 
         # PAIR.
         elif grouped_values == [1, 1, 1, 2]:
-            return self._calculate_hand_point(
+            return cls._calculate_hand_point(
                 grouped_keys, HandsOfPoker.PAIR
             )
 
         # HIGH_CARD.
         else:
-            return self._calculate_hand_point(
-                hand_values, HandsOfPoker.HIGH_CARD
+            return cls._calculate_hand_point(
+                list(hand_values), HandsOfPoker.HIGH_CARD
             )
 
     def _best_hand_score(self, hands: List[Cards]) -> Tuple[Cards, Score]:
@@ -174,8 +189,20 @@ class WinnerDetermination:
         res = {}
 
         for player in players:
-            player_hands = self._make_combinations(player.cards + cards_table)
-            best_hand, score = self._best_hand_score(player_hands)
+            cards = player.cards + cards_table
+            # Parse every card once instead of once per 5-card combination.
+            values = self._make_values(cards)
+            suits = self._make_suits(cards)
+
+            best_hand, score = [], 0
+            for idx in combinations(range(len(cards)), 5):
+                hand_point = self._score_values(
+                    tuple(sorted(values[i] for i in idx)),
+                    len({suits[i] for i in idx}) == 1,
+                )
+                if hand_point > score:
+                    best_hand = tuple(cards[i] for i in idx)
+                    score = hand_point
 
             if score not in res:
                 res[score] = []
@@ -0,0 +1,17 @@
+from pokerapp.cards import Card
+from pokerapp.compact_formatter import CompactFormatter
+
+
+def test_format_cards_maps_aliases_and_passes_glyphs_through() -> None:
+    cards = [Card("A♠"), Card("10♦"), "K:H", "Q:♣"]
+
+    assert CompactFormatter.format_cards(cards) == "A♠ T♦ K♥ Q♣"
+
+
+def test_format_card_parses_each_card_once() -> None:
+    CompactFormatter.format_card.cache_clear()
+
+    CompactFormatter.format_cards([Card("A♠"), Card("A♠"), Card("K♥")])
+
+    info = CompactFormatter.format_card.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
@@ -2,6 +2,7 @@
 
 import os
 import unittest
+from unittest import mock
 
 from pokerapp.config import Config
 
@@ -85,6 +86,38 @@ class TestConfig(ConfigEnvTestCase):
             cfg.webhook_url, "https://example.com/telegram/webhook?token=abc"
         )
 
+    def test_validate_rejects_empty_connection_pool(self) -> None:
+        with mock.patch.dict(os.environ, {"CONNECTION_POOL_SIZE": "0"}):
+            cfg = Config()
+
+        with self.assertRaises(ValueError):
+            cfg.validate()
+
+    def test_validate_rejects_unknown_http_version(self) -> None:
+        with mock.patch.dict(os.environ, {"HTTP_VERSION": "3"}):
+            cfg = Config()
+
+        with self.assertRaises(ValueError):
+            cfg.validate()
+
+    def test_http_version_defaults_to_http1(self) -> None:
+        with mock.patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("HTTP_VERSION", None)
+            cfg = Config()
+
+        self.assertEqual("1.1", cfg.HTTP_VERSION)
+
+    def test_validate_falls_back_without_h2(self) -> None:
+        with mock.patch.dict(os.environ, {"HTTP_VERSION": "2"}):
+            cfg = Config()
+
+        with mock.patch(
+            "pokerapp.config.importlib.util.find_spec", return_value=None
+        ), self.assertLogs("pokerapp.config", level="WARNING"):
+            cfg.validate()
+
+        self.assertEqual("1.1", cfg.HTTP_VERSION)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,4 @@
-from pokerapp.entities import Game
+from pokerapp.entities import Game, Player
 
 
 def test_reset_defaults_dealer_to_zero():
@@ -26,3 +26,18 @@ def test_reset_rotate_dealer_cycles_through_players():
     game.players = [object(), object(), object()]
     game.reset(rotate_dealer=True)
     assert game.dealer_index == 0
+
+
+def test_players_by_id_tracks_reassignment_and_growth():
+    game = Game()
+    alice = Player(user_id="1", mention_markdown="@a", wallet=None, ready_message_id=None)
+    bob = Player(user_id=2, mention_markdown="@b", wallet=None, ready_message_id=None)
+
+    game.players.append(alice)
+    assert game.players_by_id == {1: alice}
+
+    game.players.append(bob)
+    assert game.players_by_id.get(2) is bob
+
+    game.players = [p for p in game.players if p.user_id != 1]
+    assert game.players_by_id == {2: bob}
@@ -147,7 +147,7 @@ class GameEngineTests(unittest.IsolatedAsyncioTestCase):
         # Game state persisted to Redis-compatible KV store.
         raw_state = kv.get("game_state:test-game")
         self.assertIsNotNone(raw_state)
-        state = json.loads(raw_state.decode("utf-8"))
+        state = json.loads(raw_state)
 
         self.assertEqual(state["state"], GameState.ROUND_PRE_FLOP.name)
         self.assertEqual(state["hand_number"], 1)
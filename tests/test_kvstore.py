@@ -37,7 +37,7 @@ def test_setnx_network_error_falls_back_to_memory_store():
     assert result is True
     assert backend.calls == 1
     assert store._backend is None
-    assert store.get("foo") == b"bar"
+    assert store.get("foo") == "bar"
 
 
 def test_set_get_network_error_uses_fallback_memory_store():
@@ -45,7 +45,7 @@ def test_set_get_network_error_uses_fallback_memory_store():
 
     assert store.set("foo", "bar") is True
     assert store._backend is None
-    assert store.get("foo") == b"bar"
+    assert store.get("foo") == "bar"
 
 
 def test_chat_language_round_trip():
@@ -62,3 +62,58 @@ def test_user_language_round_trip():
     store.set_user_language(42, "de")
 
     assert store.get_user_language(42) == "de"
+
+
+def test_getdel_returns_and_removes_value():
+    store = ResilientKV(None)
+    store.set("user:1:private_game", "-100")
+
+    assert store.getdel("user:1:private_game") == "-100"
+    assert store.getdel("user:1:private_game") is None
+
+
+def test_set_membership_round_trip():
+    store = ResilientKV(None)
+    store.sadd("game:-100:members", 1, 2)
+
+    assert store.sismember("game:-100:members", "1")
+    assert store.srem("game:-100:members", 1) == 1
+    assert store.scard("game:-100:members") == 1
+    assert store.srem("game:-100:members", 2) == 1
+    assert not store.exists("game:-100:members")
+
+
+def test_authorize_funds_runs_registered_script_once():
+    calls = []
+
+    class _ScriptBackend:
+        def register_script(self, source):
+            def _run(keys, args):
+                calls.append((keys, args))
+                return 90
+
+            return _run
+
+    store = ResilientKV(_ScriptBackend())
+
+    assert store.authorize_funds("pokerbot:1", "pokerbot:1:g", 10) == 90
+    assert calls == [(["pokerbot:1", "pokerbot:1:g"], [10])]
+
+
+def test_delete_removes_several_keys_in_one_call():
+    calls = []
+
+    class _DeleteBackend:
+        def delete(self, *keys):
+            calls.append(keys)
+            return len(keys)
+
+    assert ResilientKV(_DeleteBackend()).delete("a", "b") == 2
+    assert calls == [("a", "b")]
+
+    store = ResilientKV(None)
+    store.set("a", "1")
+    store.sadd("b", 1)
+
+    assert store.delete("a", "b", "missing") == 2
+    assert not store.exists("a") and not store.exists("b")
@@ -0,0 +1,145 @@
+import logging
+from unittest.mock import MagicMock
+
+from pokerapp.cards import Card
+from pokerapp.entities import Game, Player, PlayerState
+from pokerapp.live_message import BOARD_TEXT_CACHE_SIZE, LiveMessageManager
+
+
+def _manager() -> LiveMessageManager:
+    return LiveMessageManager(bot=None, logger=logging.getLogger("test"))
+
+
+def test_board_line_is_cached_and_bounded() -> None:
+    manager = _manager()
+    board = [Card("A♠"), Card("K♥"), Card("10♦")]
+
+    first = manager._format_board_cards(board)
+    assert manager._format_board_cards(list(board)) is first
+
+    for rank in range(BOARD_TEXT_CACHE_SIZE + 1):
+        manager._format_board_cards([Card(f"{rank}♣")])
+    assert len(manager._board_text_cache) == BOARD_TEXT_CACHE_SIZE
+    assert tuple(board) not in manager._board_text_cache
+
+
+def test_unchanged_table_text_is_served_from_cache() -> None:
+    manager = _manager()
+    game = Game()
+    game.players = [
+        Player(
+            user_id=1,
+            mention_markdown="[Alice](tg://user?id=1)",
+            wallet=MagicMock(value=MagicMock(return_value=500)),
+            ready_message_id=None,
+        )
+    ]
+    game.pot = 30
+
+    first = manager._format_game_state(game)
+    assert manager._format_game_state(game) is first
+
+    game.pot = 60
+    assert manager._format_game_state(game) is not first
+
+
+def test_player_lines_mark_actor_folded_and_waiting_seats() -> None:
+    manager = _manager()
+    game = Game()
+    game.players = [
+        Player(
+            user_id=user_id,
+            mention_markdown=f"[P{user_id}](tg://user?id={user_id})",
+            wallet=MagicMock(value=MagicMock(return_value=100)),
+            ready_message_id=None,
+        )
+        for user_id in (1, 2, 3)
+    ]
+    game.players[1].state = PlayerState.FOLD
+    game.current_player_index = 0
+
+    text = manager._format_game_state(game)
+
+    assert "✅ P1 • $100\n❌ P2 • $100 • " in text
+    assert "\n🚫 P3 • $100 • " in text
+
+
+def test_action_callbacks_carry_version_and_game_id() -> None:
+    manager = _manager()
+    game = Game()
+    player = Player(
+        user_id=1,
+        mention_markdown="[A](tg://user?id=1)",
+        wallet=MagicMock(value=MagicMock(return_value=500)),
+        ready_message_id=None,
+    )
+    game.players = [player]
+
+    markup, _ = manager._build_action_inline_keyboard(
+        game, player, 3, use_cache=False
+    )
+
+    callbacks = [b.callback_data for row in markup.inline_keyboard for b in row]
+    assert f"action:check:3:{game.id}" in callbacks
+    assert f"action:raise:start:3:{game.id}" in callbacks
+
+
+def test_player_name_comes_from_mention_or_user_id() -> None:
+    manager = _manager()
+    named = Player(1, "[Alice](tg://user?id=1)", MagicMock(), None)
+    handle = Player(2, "@bob", MagicMock(), None)
+
+    assert manager._get_player_name(named) == "Alice"
+    assert manager._get_player_name(handle) == "User 2"
+
+
+def test_pot_change_reuses_cached_seat_block() -> None:
+    manager = _manager()
+    game = Game()
+    game.players = [
+        Player(1, "[Alice](tg://user?id=1)", MagicMock(value=MagicMock(return_value=500)), None)
+    ]
+    manager._format_game_state(game)
+    manager._render_seat_block = MagicMock(side_effect=AssertionError("seats unchanged"))
+
+    game.pot = 90
+    assert "$90" in manager._format_game_state(game)
+
+
+def test_action_keyboard_reused_until_inputs_change() -> None:
+    manager = _manager()
+    game = Game()
+    wallet = MagicMock(value=MagicMock(return_value=500))
+    player = Player(1, "[A](tg://user?id=1)", wallet, None)
+    game.players = [player]
+
+    first, _ = manager._build_action_inline_keyboard(game, player, 3, use_cache=False)
+    again, _ = manager._build_action_inline_keyboard(game, player, 3)
+    bumped, _ = manager._build_action_inline_keyboard(game, player, 4)
+
+    assert again is first
+    assert bumped is not first
+    assert bumped.inline_keyboard[0][0].callback_data == f"action:check:4:{game.id}"
+
+
+def test_mobile_action_labels_pad_scaled_emoji() -> None:
+    from pokerapp.device_detector import DeviceDetector, DeviceType
+
+    manager = _manager()
+    game = Game()
+    player = Player(
+        1, "[A](tg://user?id=1)", MagicMock(value=MagicMock(return_value=500)), None
+    )
+    game.players = [player]
+
+    markup, _ = manager._build_action_inline_keyboard(
+        game,
+        player,
+        1,
+        use_cache=False,
+        device_profile=DeviceDetector.PROFILES[DeviceType.MOBILE],
+    )
+
+    labels = [button.text for row in markup.inline_keyboard for button in row]
+    assert labels[0] == "✅\u200a CHECK"
+    assert labels[-1] == "❌\u200a FOLD"
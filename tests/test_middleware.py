@@ -3,9 +3,12 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import telegram
+from telegram.ext import BaseUpdateProcessor
+
 from pokerapp.i18n import TranslationManager
 from pokerapp.kvstore import InMemoryKV
-from pokerapp.middleware import PokerBotMiddleware
+from pokerapp.middleware import ChatOrderedUpdateProcessor, PokerBotMiddleware
 
 
 TRANSLATIONS_DIR = Path(__file__).resolve().parent.parent / "translations"
@@ -52,3 +55,114 @@ def test_build_menu_context_prefers_stored_user_language() -> None:
     )
 
     assert context.language_code == "es"
+
+
+def _callback_update(chat_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        callback_query=object(),
+        effective_chat=SimpleNamespace(id=chat_id),
+    )
+
+
+def test_chat_ordered_processor_serializes_per_chat_only() -> None:
+    """Callbacks in one chat run in order without blocking other chats."""
+
+    events: list[str] = []
+
+    async def _handler(name: str, gate: asyncio.Event) -> None:
+        events.append(f"{name}:start")
+        await gate.wait()
+        events.append(f"{name}:end")
+
+    async def _scenario() -> None:
+        processor = ChatOrderedUpdateProcessor(8)
+        slow_gate = asyncio.Event()
+        open_gate = asyncio.Event()
+        open_gate.set()
+
+        first = asyncio.create_task(
+            processor.process_update(_callback_update(1), _handler("a1", slow_gate))
+        )
+        second = asyncio.create_task(
+            processor.process_update(_callback_update(1), _handler("a2", open_gate))
+        )
+        other = asyncio.create_task(
+            processor.process_update(_callback_update(2), _handler("b1", open_gate))
+        )
+
+        await other
+        assert "b1:end" in events
+        assert "a2:start" not in events
+
+        slow_gate.set()
+        await asyncio.gather(first, second)
+        assert processor._chat_locks == {}
+
+    asyncio.run(_scenario())
+
+    assert events.index("a1:end") < events.index("a2:start")
+
+
+def test_base_processor_contract_matches_chat_ordered_override() -> None:
+    """ChatOrderedUpdateProcessor.process_update relies on this PTB detail.
+
+    The override waits on a chat lock and then defers to the base
+    ``process_update``, which must take the global semaphore around
+    ``do_process_update``. Re-check the override before bumping PTB.
+    """
+
+    assert telegram.__version__.startswith("21."), telegram.__version__
+
+    slots_free: list[bool] = []
+
+    class _Probe(BaseUpdateProcessor):
+        async def do_process_update(self, update, coroutine) -> None:
+            slots_free.append(not self._semaphore.locked())
+            await coroutine
+
+        async def initialize(self) -> None:
+            pass
+
+        async def shutdown(self) -> None:
+            pass
+
+    async def _noop() -> None:
+        return None
+
+    probe = _Probe(1)
+    asyncio.run(probe.process_update(object(), _noop()))
+
+    assert slots_free == [False]
+
+
+def test_chat_ordered_processor_waiters_do_not_hold_global_slots() -> None:
+    """A burst queued in one chat must leave slots free for other chats."""
+
+    async def _scenario() -> None:
+        processor = ChatOrderedUpdateProcessor(2)
+        gate = asyncio.Event()
+        ran: list[str] = []
+
+        async def _handler(name: str, wait: bool) -> None:
+            ran.append(name)
+            if wait:
+                await gate.wait()
+
+        busy = [
+            asyncio.create_task(
+                processor.process_update(_callback_update(1), _handler(f"a{i}", True))
+            )
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(
+            processor.process_update(_callback_update(2), _handler("b", False)),
+            timeout=1,
+        )
+        assert ran == ["a0", "b"]
+
+        gate.set()
+        await asyncio.gather(*busy)
+
+    asyncio.run(_scenario())
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import asyncio
 import unittest
 from types import SimpleNamespace
 from typing import Dict, Tuple
@@ -7,7 +8,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import redis
 from telegram import Bot
+from telegram.error import NetworkError
 
+from pokerapp.betting import SidePotCalculator
 from pokerapp.cards import Cards, Card
 from pokerapp.config import Config
 from pokerapp.entities import (
@@ -17,11 +20,15 @@ from pokerapp.entities import (
     Player,
     PlayerState,
     Score,
+    UserException,
 )
 from pokerapp.game_coordinator import GameCoordinator
 from pokerapp.game_engine import TurnResult
 from pokerapp.kvstore import InMemoryKV
+from pokerapp.privatechatmodel import UserPrivateChatModel
+from pokerapp.request_cache import RequestCache, current_request_cache
 from pokerapp.pokerbotmodel import (
+    DEFAULT_MONEY,
     KEY_CHAT_DATA_GAME,
     PokerBotModel,
     WalletManagerModel,
@@ -233,6 +240,110 @@ class TestGameCoordinatorPayouts(unittest.TestCase):
             fourth_loser,
         )
 
+    def test_authorized_money_many_matches_single_lookups(self):
+        g = Game()
+        first = self._next_player(g, 15)
+        second = self._next_player(g, 40)
+
+        amounts = WalletManagerModel.authorized_money_many(
+            self._kv,
+            [first.user_id, second.user_id, -1],
+            g.id,
+        )
+
+        self.assertEqual(
+            {first.user_id: 15, second.user_id: 40, -1: 0},
+            amounts,
+        )
+        self._approve_all(g)
+
+    def test_side_pots_read_authorized_money_with_one_mget(self):
+        g = Game()
+        self._next_player(g, 15)
+        self._next_player(g, 40)
+
+        with patch.object(
+            WalletManagerModel,
+            "authorized_money",
+            side_effect=AssertionError("use MGET"),
+        ):
+            side_pots = SidePotCalculator().calculate_side_pots(g)
+
+        self.assertEqual([30, 25], [pot.amount for pot in side_pots])
+        self._approve_all(g)
+
+
+class WalletBalanceCacheTests(unittest.TestCase):
+    def test_value_reads_redis_once_per_active_request_cache(self):
+        kv = InMemoryKV()
+        wallet = WalletManagerModel(77, kv=kv)
+        original_get = kv.get
+        reads = []
+
+        def counting_get(key):
+            reads.append(key)
+            return original_get(key)
+
+        kv.get = counting_get
+
+        with RequestCache().activate():
+            first = wallet.value()
+            second = wallet.value()
+            wallet.inc(-100)
+            after_inc = wallet.value()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first - 100, after_inc)
+        self.assertEqual(1, len(reads))
+
+        wallet.value()
+        self.assertEqual(2, len(reads))
+
+    def test_inc_rejects_overdraft_without_changing_balance(self):
+        wallet = WalletManagerModel(78, kv=InMemoryKV())
+        balance = wallet.value()
+
+        with self.assertRaises(UserException):
+            wallet.inc(-(balance + 1))
+
+        self.assertEqual(balance, wallet.value())
+
+    def test_wallet_bootstrap_is_a_single_setnx(self):
+        kv = InMemoryKV()
+        kv.get = MagicMock(side_effect=AssertionError("no GET on init"))
+
+        WalletManagerModel(81, kv=kv)
+        kv.incrby(WalletManagerModel._prefix(81), 5)
+        WalletManagerModel(81, kv=kv)
+
+        self.assertEqual(
+            str(DEFAULT_MONEY + 5),
+            kv.mget([WalletManagerModel._prefix(81)])[0],
+        )
+
+    def test_authorize_overdraft_moves_nothing(self):
+        wallet = WalletManagerModel(80, kv=InMemoryKV())
+        balance = wallet.value()
+
+        with self.assertRaises(UserException):
+            wallet.authorize("g1", balance + 1)
+        self.assertEqual(0, wallet.authorized_money("g1"))
+
+        self.assertEqual(balance, wallet.authorize_all("g1"))
+        self.assertEqual(balance, wallet.authorized_money("g1"))
+        self.assertEqual(0, wallet.value())
+
+    def test_snapshot_reads_balance_and_daily_flag_together(self):
+        kv = InMemoryKV()
+        wallet = WalletManagerModel(79, kv=kv)
+        kv.get = MagicMock(side_effect=AssertionError("expected MGET"))
+
+        balance, claimed = wallet.snapshot()
+        self.assertFalse(claimed)
+
+        wallet.add_daily(amount=50)
+        self.assertEqual((balance + 50, True), wallet.snapshot())
+
 
 class HandlePlayerActionStateTests(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self) -> None:
@@ -349,6 +460,271 @@ class HandlePlayerActionStateTests(unittest.IsolatedAsyncioTestCase):
         mock_finish.assert_awaited_once_with(self.game, self.chat_id)
         coordinator.process_game_turn.assert_not_called()
 
+    async def test_all_in_run_out_refreshes_board_once(self) -> None:
+        coordinator = self.model._coordinator
+        coordinator.advance_game_street = MagicMock(
+            side_effect=[
+                (GameState.ROUND_FLOP, 3),
+                (GameState.ROUND_TURN, 1),
+                (GameState.ROUND_RIVER, 1),
+                (GameState.FINISHED, 0),
+            ]
+        )
+        coordinator.process_game_turn = MagicMock(
+            return_value=(TurnResult.END_ROUND, None)
+        )
+
+        with patch.object(
+            self.model, "_finish_game", new=AsyncMock()
+        ) as mock_finish, patch.object(
+            self.model, "_send_live_manager_update", new=AsyncMock()
+        ) as mock_update:
+            await self.model._advance_to_next_street(self.game, self.chat_id)
+
+        self.assertEqual(5, len(self.game.cards_table))
+        mock_update.assert_awaited_once_with(self.game, self.chat_id)
+        mock_finish.assert_awaited_once_with(self.game, self.chat_id)
+
+    async def test_action_messages_are_flushed_together(self) -> None:
+        self.mock_view.send_message = AsyncMock()
+
+        with patch("pokerapp.pokerbotmodel.ACTION_LOG_FLUSH_DELAY", 0):
+            self.model._queue_action_message(self.chat_id, "@a fold")
+            self.model._queue_action_message(self.chat_id, "@b check")
+            await asyncio.gather(*self.model._background_tasks)
+
+        self.mock_view.send_message.assert_awaited_once_with(
+            chat_id=self.chat_id,
+            text="@a fold\n@b check",
+        )
+        self.assertEqual({}, self.model._action_buf)
+
+    async def test_action_messages_precede_game_results(self) -> None:
+        self.mock_view.send_message = AsyncMock()
+        self.game.state = GameState.ROUND_RIVER
+        self.game.players[0].wallet = MagicMock()
+
+        self.model._queue_action_message(self.chat_id, "Time is over!")
+        self.model._queue_action_message(self.chat_id, "@player fold")
+        await self.model._finish_game(self.game, self.chat_id)
+
+        texts = [
+            call.kwargs["text"]
+            for call in self.mock_view.send_message.await_args_list
+        ]
+        self.assertEqual("Time is over!\n@player fold", texts[0])
+        self.assertTrue(texts[1].startswith("Game is finished"))
+        self.assertEqual({}, self.model._action_buf)
+
+    async def test_results_wait_for_an_action_flush_in_flight(self) -> None:
+        release = asyncio.Event()
+        texts = []
+
+        async def _send(chat_id, text):
+            if text == "@player fold":
+                await release.wait()
+            texts.append(text)
+
+        self.mock_view.send_message = AsyncMock(side_effect=_send)
+        self.game.players[0].wallet = MagicMock()
+
+        with patch("pokerapp.pokerbotmodel.ACTION_LOG_FLUSH_DELAY", 0):
+            self.model._queue_action_message(self.chat_id, "@player fold")
+            await asyncio.sleep(0.01)  # the flush is now blocked mid-send
+
+        finish = asyncio.create_task(
+            self.model._finish_game(self.game, self.chat_id)
+        )
+        await asyncio.sleep(0.01)
+        self.assertEqual([], texts)
+
+        release.set()
+        await finish
+
+        self.assertEqual("@player fold", texts[0])
+        self.assertTrue(texts[1].startswith("Game is finished"))
+
+    async def test_action_log_failures_do_not_block_settlement(self) -> None:
+        sent = []
+
+        async def _send(chat_id, text):
+            if text.startswith("@a"):
+                raise NetworkError("telegram down")
+            sent.append(text)
+
+        self.mock_view.send_message = AsyncMock(side_effect=_send)
+        self.game.players[0].wallet = MagicMock()
+
+        with patch("pokerapp.pokerbotmodel.TELEGRAM_MESSAGE_LIMIT", 5):
+            self.model._queue_action_message(self.chat_id, "@a fold")
+            self.model._queue_action_message(self.chat_id, "@b call")
+            with self.assertLogs("pokerapp.pokerbotmodel", level="WARNING"):
+                await self.model._finish_game(self.game, self.chat_id)
+
+        self.assertEqual("@b call", sent[0])
+        self.assertTrue(sent[1].startswith("Game is finished"))
+        self.assertEqual({}, self.model._action_flush)
+
+    async def test_fold_confirm_executions_read_fresh_balances(self) -> None:
+        wallet = WalletManagerModel(self.player.user_id, kv=self.kv_store)
+        seen = []
+
+        async def _record(prepared, cache) -> bool:
+            seen.append(wallet.value())
+            return True
+
+        with patch.object(
+            self.model, "_execute_prepared_action", side_effect=_record
+        ):
+            await self.model.execute_player_action(MagicMock())
+            self.kv_store.incrby(
+                WalletManagerModel._prefix(self.player.user_id), 50
+            )
+            await self.model.execute_player_action(MagicMock())
+
+        self.assertEqual(seen[0] + 50, seen[1])
+        self.assertIsNone(current_request_cache())
+
+    async def test_background_tasks_do_not_inherit_request_cache(self) -> None:
+        async def _active_cache():
+            return current_request_cache()
+
+        with RequestCache().activate():
+            task = self.model._fire_and_forget(_active_cache(), "probe")
+
+        self.assertIsNone(await task)
+
+    async def test_fire_and_forget_logs_failures(self) -> None:
+        async def _boom() -> None:
+            raise RuntimeError("telegram down")
+
+        with self.assertLogs("pokerapp.pokerbotmodel", level="WARNING") as logs:
+            task = self.model._fire_and_forget(_boom(), "host ping")
+            await asyncio.gather(task, return_exceptions=True)
+            await asyncio.sleep(0)
+
+        self.assertIn("host ping", logs.output[0])
+        self.assertFalse(self.model._background_tasks)
+
+    async def test_get_wallet_reuses_instance_per_user(self) -> None:
+        wallet = self.model._get_wallet(1)
+
+        self.assertIs(wallet, self.model._get_wallet(1))
+        self.assertIsNot(wallet, self.model._get_wallet(2))
+
+    async def test_wallet_cache_evicts_least_recently_used(self) -> None:
+        with patch("pokerapp.pokerbotmodel.WALLET_CACHE_SIZE", 2):
+            first = self.model._get_wallet(1)
+            self.model._get_wallet(2)
+            self.model._get_wallet(1)
+            self.model._get_wallet(3)
+
+        self.assertEqual([1, 3], list(self.model._wallets))
+        self.assertIs(first, self.model._get_wallet(1))
+
+    async def test_cached_wallet_rebootstraps_removed_balance(self) -> None:
+        wallet = self.model._get_wallet(1)
+        self.kv_store.delete(WalletManagerModel._prefix(1))
+
+        self.assertEqual(DEFAULT_MONEY, self.model._get_wallet(1).value())
+        self.assertEqual(DEFAULT_MONEY, await self.model._get_user_balance(1))
+        self.assertIs(wallet, self.model._get_wallet(1))
+
+    async def test_get_chat_member_reuses_fresh_reply(self) -> None:
+        self.mock_bot.get_chat_member = AsyncMock(return_value="member")
+
+        await self.model._get_chat_member(-100, 1)
+        self.assertEqual("member", await self.model._get_chat_member(-100, 1))
+        self.mock_bot.get_chat_member.assert_awaited_once_with(-100, 1)
+
+        self.model._invalidate_chat_member(-100, 1)
+        await self.model._get_chat_member(-100, 1)
+        self.assertEqual(2, self.mock_bot.get_chat_member.await_count)
+
+    async def test_chat_member_cache_evicts_oldest_entry(self) -> None:
+        self.mock_bot.get_chat_member = AsyncMock(return_value="member")
+
+        with patch("pokerapp.pokerbotmodel.CHAT_MEMBER_CACHE_SIZE", 2):
+            for user_id in (1, 2, 3):
+                await self.model._get_chat_member(-100, user_id)
+
+        self.assertEqual(
+            [(-100, 2), (-100, 3)], list(self.model._chat_member_cache)
+        )
+
+    async def test_check_access_caches_admin_ids(self) -> None:
+        admin = SimpleNamespace(user=SimpleNamespace(id=7))
+        self.mock_bot.get_chat_administrators = AsyncMock(return_value=[admin])
+
+        self.assertTrue(await self.model._check_access(-100, 7))
+        self.assertFalse(await self.model._check_access(-100, 8))
+        self.mock_bot.get_chat_administrators.assert_awaited_once_with(-100)
+
+    async def test_admins_cache_evicts_oldest_chat(self) -> None:
+        self.mock_bot.get_chat_administrators = AsyncMock(return_value=[])
+
+        with patch("pokerapp.pokerbotmodel.CHAT_ADMINS_CACHE_SIZE", 2):
+            for chat_id in (-1, -2, -3):
+                await self.model._check_access(chat_id, 7)
+
+        self.assertEqual([-2, -3], list(self.model._admins_cache))
+
+    async def test_deal_cards_gives_two_unique_cards_per_player(self) -> None:
+        second = Player(
+            user_id=456,
+            mention_markdown="@second",
+            wallet=MagicMock(),
+            ready_message_id=None,
+        )
+        self.game.players = [self.player, second]
+
+        self.model._deal_cards_to_players(self.game)
+
+        hole_cards = self.player.cards + second.cards
+        self.assertEqual(2, len(self.player.cards))
+        self.assertEqual(4, len(set(hole_cards)))
+        self.assertEqual(48, len(self.game.remain_cards))
+        self.assertFalse(set(hole_cards) & set(self.game.remain_cards))
+
+    async def test_send_cards_batch_reads_chat_ids_with_one_mget(self) -> None:
+        UserPrivateChatModel(self.player.user_id, self.kv_store).set_chat_id(55)
+        self.mock_view.send_or_update_private_hand = AsyncMock(return_value=1)
+        self.kv_store.get = MagicMock(side_effect=AssertionError("use MGET"))
+
+        await self.model._send_cards_batch([self.player], self.chat_id)
+
+        kwargs = self.mock_view.send_or_update_private_hand.await_args.kwargs
+        self.assertEqual("55", kwargs["chat_id"])
+
+    async def test_private_hands_are_sent_concurrently_within_the_bound(
+        self,
+    ) -> None:
+        self.game.players = [
+            Player(
+                user_id=user_id,
+                mention_markdown=f"@p{user_id}",
+                wallet=MagicMock(),
+                ready_message_id=None,
+            )
+            for user_id in (1, 2, 3)
+        ]
+        self.model._send_sem = asyncio.Semaphore(2)
+        in_flight = peak = 0
+
+        async def send(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        self.mock_view.send_or_update_private_hand = AsyncMock(side_effect=send)
+
+        await self.model._send_private_cards_to_all(self.game, MagicMock())
+
+        self.assertEqual(3, self.mock_view.send_or_update_private_hand.await_count)
+        self.assertEqual(2, peak)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from pokerapp.cards import Card
+from pokerapp.pokerbotview import PokerBotViewer
+
+
+def _viewer() -> PokerBotViewer:
+    bot = MagicMock()
+    bot.send_message = AsyncMock()
+    bot.edit_message_text = AsyncMock()
+    return PokerBotViewer(bot=bot)
+
+
+def test_stake_selection_reuses_keyboard_per_language() -> None:
+    viewer = _viewer()
+
+    asyncio.run(viewer.send_stake_selection(1, "Alice", language_code="en"))
+    asyncio.run(viewer.send_stake_selection(2, "Bob", language_code="en"))
+
+    first, second = (
+        call.kwargs["reply_markup"]
+        for call in viewer._bot.send_message.await_args_list
+    )
+    assert first is second
+    assert [row[0].callback_data for row in first.inline_keyboard] == [
+        "stake:micro",
+        "stake:low",
+        "stake:medium",
+        "stake:high",
+        "stake:premium",
+        "stake:language",
+        "stake:cancel",
+    ]
+
+
+def test_format_card_is_memoized() -> None:
+    PokerBotViewer._format_card.cache_clear()
+
+    first = PokerBotViewer._format_card(Card("A♠"))
+    second = PokerBotViewer._format_card(Card("A♠"))
+
+    assert first == "♠️A"
+    assert second is first
+    assert PokerBotViewer._format_card.cache_info().hits == 1
+
+
+def test_stake_selection_text_matches_on_send_and_edit() -> None:
+    viewer = _viewer()
+
+    asyncio.run(viewer.send_stake_selection(1, "Alice", language_code="en"))
+    asyncio.run(
+        viewer.send_stake_selection(1, "Alice", language_code="en", message_id=7)
+    )
+
+    sent = viewer._bot.send_message.await_args.kwargs["text"]
+    edited = viewer._bot.edit_message_text.await_args.kwargs["text"]
+    assert sent == edited
+    assert "{options}" not in sent
+
+
+def test_private_game_status_lists_players() -> None:
+    viewer = _viewer()
+
+    asyncio.run(
+        viewer.send_private_game_status(
+            chat_id=1,
+            host_name="Alice",
+            stake_name="Low",
+            game_code="ABC123",
+            current_players=2,
+            max_players=6,
+            min_players=2,
+            player_names=["Alice", "Bob"],
+            can_start=True,
+        )
+    )
+
+    text = viewer._bot.send_message.await_args.kwargs["text"]
+    assert " • Alice\n • Bob" in text
+
+
+def test_board_cards_line_joins_formatted_cards() -> None:
+    board = [Card("A♠"), Card("K♥"), Card("10♦")]
+
+    assert PokerBotViewer._format_board_cards(board) == "♠️A  ♥️K  ♦️10"
+    assert PokerBotViewer._format_board_cards([]) == "Waiting for flop…"
+
+
+def test_invitation_message_formats_stake_amounts() -> None:
+    viewer = _viewer()
+    stake = {
+        "name": "High",
+        "small_blind": 1000,
+        "big_blind": 2000,
+        "min_buyin": 100000,
+    }
+
+    message, keyboard = viewer.build_invitation_message("Alice", "ABC123", stake)
+
+    assert "$1,000" in message and "$2,000" in message and "$100,000" in message
+    assert keyboard.inline_keyboard[0][0].callback_data == "invite_accept:ABC123"
+
+
+def test_send_cards_replies_to_ready_message_when_given() -> None:
+    viewer = _viewer()
+    cards = [Card("A♠"), Card("K♥")]
+
+    asyncio.run(viewer.send_cards(1, cards, "@alice", 42))
+    asyncio.run(viewer.send_cards(1, cards, "@alice", None))
+
+    first, second = viewer._bot.send_message.await_args_list
+    assert first.kwargs["reply_to_message_id"] == 42
+    assert second.kwargs["reply_to_message_id"] is None
+
+
+def test_desktop_action_buttons_add_pot_raise_row() -> None:
+    from pokerapp.device_detector import DeviceDetector, DeviceType
+    from pokerapp.entities import Game, Player, Wallet
+
+    viewer = _viewer()
+    viewer._live_manager = None
+    viewer._render_cache = None
+
+    wallet = MagicMock(spec=Wallet)
+    wallet.value.return_value = 500
+    player = Player(1, "@alice", wallet, None)
+    game = Game()
+    game.pot = 300
+
+    markup = viewer.build_action_buttons(
+        game,
+        player,
+        device_profile=DeviceDetector.PROFILES[DeviceType.DESKTOP],
+    )
+
+    callbacks = [
+        [button.callback_data for button in row] for row in markup.inline_keyboard
+    ]
+    game_id = str(game.id)
+    assert callbacks == [
+        [f"action:check:{game_id}", f"action:fold:{game_id}"],
+        [f"action:raise:20:{game_id}", f"action:all_in:{game_id}"],
+        [f"action:raise:300:{game_id}"],
+    ]
+
+
+def test_removed_message_skips_repeat_delete_and_markup_edit() -> None:
+    viewer = _viewer()
+    viewer._bot.delete_message = AsyncMock()
+    viewer._bot.edit_message_reply_markup = AsyncMock()
+
+    asyncio.run(viewer.remove_message(chat_id=1, message_id=5))
+    asyncio.run(viewer.remove_message(chat_id=1, message_id=5))
+    asyncio.run(viewer.remove_markup(chat_id=1, message_id=5))
+    asyncio.run(viewer.remove_markup(chat_id=1, message_id=6))
+
+    assert viewer._bot.delete_message.await_count == 1
+    viewer._bot.edit_message_reply_markup.assert_awaited_once_with(
+        chat_id=1, message_id=6
+    )
+
+
+def test_hand_panel_table_half_is_shared_across_seats() -> None:
+    PokerBotViewer._render_table_panel.cache_clear()
+    board = [Card("A♠"), Card("K♥"), Card("10♦")]
+
+    first = _viewer().build_hand_panel([Card("2♣"), Card("3♣")], board, pot=150)
+    second = _viewer().build_hand_panel([Card("4♦"), Card("5♦")], board, pot=150)
+
+    assert "♣️2  ♣️3" in first and "♠️A  ♥️K  ♦️10" in first
+    assert "♦️4  ♦️5" in second and "♠️A  ♥️K  ♦️10" in second
+    assert "$150" in first and "$150" in second
+    assert PokerBotViewer._render_table_panel.cache_info().hits == 1
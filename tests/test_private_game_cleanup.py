@@ -15,10 +15,11 @@ import json
 import unittest
 from collections import defaultdict
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 from telegram import Bot
 
-from pokerapp.pokerbotmodel import PokerBotModel
+from pokerapp.entities import Game, Player
+from pokerapp.pokerbotmodel import KEY_CHAT_DATA_GAME, PokerBotModel
 from pokerapp.kvstore import InMemoryKV
 from pokerapp.config import Config
 
@@ -430,6 +431,106 @@ class PrivateGameCleanupTests(unittest.IsolatedAsyncioTestCase):
                 chat_id, game_code
             )
 
+    async def test_delete_lobby_invalidates_cached_status(self):
+        """Cached lobby state must not outlive the deleted lobby key."""
+
+        game_code = "CACHE1"
+        self.poker_model._cache_private_game(game_code, object())
+
+        await self.poker_model.delete_private_game_lobby(-1300, game_code)
+
+        self.assertIsNone(self.poker_model._get_cached_private_game(game_code))
+
+    async def test_cache_insert_evicts_expired_and_overflow_entries(self):
+        """Single-use lobby codes must not pile up in the status cache."""
+
+        cache = self.poker_model._private_game_cache
+        with patch("pokerapp.pokerbotmodel.time.monotonic", return_value=0):
+            self.poker_model._cache_private_game("OLD001", object())
+
+        with patch("pokerapp.pokerbotmodel.PRIVATE_GAME_CACHE_SIZE", 2):
+            for code in ("NEW001", "NEW002", "NEW003"):
+                self.poker_model._cache_private_game(code, object())
+
+        self.assertEqual(["NEW002", "NEW003"], list(cache))
+
+    async def test_accept_invite_invalidates_cached_status(self):
+        """Accepting rewrites the lobby, so the cached copy must go too."""
+
+        from pokerapp.private_game import PrivateGame, PrivateGameInvite
+
+        game_code = "CACHE2"
+        user_id = 200
+        private_game = PrivateGame(
+            game_code=game_code,
+            host_user_id=100,
+            stake_level="micro",
+        )
+        private_game.invited_players[user_id] = PrivateGameInvite(
+            user_id=user_id, username="guest", invited_at=0
+        )
+        self.kv_store.set("private_game:" + game_code, private_game.to_json())
+        self.poker_model._cache_private_game(game_code, private_game)
+
+        self.poker_model._apply_user_language = MagicMock(return_value="en")
+        self.poker_model._ensure_minimum_balance = AsyncMock(return_value=True)
+        self.poker_model._get_wallet = MagicMock()
+
+        update = MagicMock()
+        update.callback_query.from_user.id = user_id
+        update.callback_query.from_user.username = "guest"
+        update.callback_query.edit_message_text = AsyncMock()
+        context = MagicMock()
+        context.bot.send_message = AsyncMock()
+
+        await self.poker_model.accept_private_game_invite(
+            update, context, game_code
+        )
+
+        self.assertIsNone(self.poker_model._get_cached_private_game(game_code))
+
+    async def test_delete_lobby_removes_members_set(self):
+        """A cancelled lobby must not leave its member ids to the next one."""
+
+        chat_id = -1400
+        members_key = self.poker_model._lobby_members_key(chat_id)
+        # Bypass the sadd stub above so the set lands in the real store.
+        InMemoryKV.sadd(self.kv_store, members_key, 100, 999)
+
+        await self.poker_model.delete_private_game_lobby(chat_id, "GHOST1")
+
+        self.assertFalse(self.kv_store.exists(members_key))
+
+    async def test_last_member_leaving_tears_down_lobby_and_members(self):
+        """A stale id in a pre-existing members set can't keep the lobby alive."""
+
+        chat_id = -1500
+        user_id = 100
+        members_key = self.poker_model._lobby_members_key(chat_id)
+        InMemoryKV.sadd(self.kv_store, members_key, user_id, 999)
+        self.kv_store.srem = lambda key, *values: InMemoryKV.srem(  # type: ignore[attr-defined]
+            self.kv_store, key, *values
+        )
+        self.kv_store.set(
+            "user:" + str(user_id) + ":private_game", str(chat_id)
+        )
+
+        game = Game()
+        game.players = [Player(user_id, "@host", MagicMock(), None)]
+        self.poker_model._application.chat_data[chat_id] = {
+            KEY_CHAT_DATA_GAME: game
+        }
+        self.poker_model._apply_user_language = MagicMock(return_value="en")
+
+        update = MagicMock()
+        update.effective_user.id = user_id
+        update.effective_message.reply_text = AsyncMock()
+
+        await self.poker_model.leave_private_game(update, MagicMock())
+
+        self.assertNotIn(chat_id, self.poker_model._application.chat_data)
+        self.assertFalse(self.kv_store.exists(members_key))
+
 # ============================================================================
 # RUN TESTS
 # ============================================================================
@@ -218,3 +218,25 @@ def test_stored_language_preference_is_not_overwritten_by_detection() -> None:
 
     assert resolved == "fa"
     assert kv.get_user_language(7) == "fa"
+
+
+def test_translate_without_variables_returns_template_unchanged() -> None:
+    """Templates are only formatted when variables or placeholders exist."""
+
+    manager = TranslationManager(translations_dir=str(TRANSLATIONS_DIR))
+    manager.translations["en"]["test.plain"] = "Pot"
+    manager.translations["en"]["test.placeholder"] = "Pot {amount}"
+
+    assert manager.translate("test.plain") is manager.translations["en"]["test.plain"]
+    assert manager.translate("test.placeholder") == "Pot {amount}"
+    assert manager.translate("test.placeholder", amount=5) == "Pot 5"
+
+
+def test_format_currency_uses_language_layout() -> None:
+    """Currency strings follow the per-language separator rules."""
+
+    manager = _translation_manager_instance()
+
+    assert manager.format_currency(1500, "en") == "$1,500"
+    assert manager.format_currency(1500, "ru") == "1 500 $"
+    assert manager.format_currency(1500, "xx", currency_symbol="") == "1,500"
@@ -5,6 +5,7 @@ import unittest
 from typing import Tuple
 
 from pokerapp.cards import Cards, Card
+from pokerapp.entities import Player
 from pokerapp.winnerdetermination import WinnerDetermination
 
 
@@ -44,6 +45,24 @@ class TestWinnerDetermination(unittest.TestCase):
             got_best_hand = determinator._best_hand_score(hands)[0]
             self.assertListEqual(list1=got_best_hand, list2=hands[0])
 
+    def test_determinate_scores_matches_combination_scan(self):
+        determinator = WinnerDetermination()
+        table = [Card(c) for c in ("10♥", "J♥", "Q♥", "2♠", "2♦")]
+        players = [
+            Player(1, "@a", None, None),
+            Player(2, "@b", None, None),
+        ]
+        players[0].cards = [Card("K♥"), Card("A♥")]
+        players[1].cards = [Card("2♣"), Card("2♥")]
+
+        scores = determinator.determinate_scores(players, table)
+
+        for player in players:
+            expected = determinator._best_hand_score(
+                determinator._make_combinations(player.cards + table)
+            )
+            self.assertIn((player, expected[0]), scores[expected[1]])
+
 
 if __name__ == '__main__':
     unittest.main()